@@ -7,11 +7,16 @@ from textual.containers import Vertical, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Static, DataTable, Button, TabbedContent, TabPane
 
-from ..utils.bookmarks import BookmarkManager
+from ..utils.bookmarks import BookmarkManager, JobBookmark, ScriptBookmark
+from .editor import EditorScreen
 
 
 class BookmarksScreen(ModalScreen):
-    """Modal screen for viewing and managing bookmarks."""
+    """Modal screen for viewing and managing bookmarks.
+
+    The app installs a single instance and re-pushes it by name, so the
+    widget tree is built once and each re-open only syncs changed rows.
+    """
 
     DEFAULT_CSS = """
     BookmarksScreen {
@@ -96,6 +101,14 @@ class BookmarksScreen(ModalScreen):
     def __init__(self, bookmark_manager: BookmarkManager):
         super().__init__()
         self.bookmark_manager = bookmark_manager
+        # Bookmarks currently shown, in table row order. Refreshes diff
+        # against these so only added/removed rows are touched, and actions
+        # index them by cursor row instead of re-fetching from the manager.
+        self._jobs_cache: tuple[JobBookmark, ...] = ()
+        self._scripts_cache: tuple[ScriptBookmark, ...] = ()
+        # Removal toasts raised within a short window are merged into one
+        self._pending_removals: list[str] = []
+        self._removal_timer = None
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -105,13 +118,11 @@ class BookmarksScreen(ModalScreen):
                 with TabPane("Jobs", id="jobs-tab"):
                     table = DataTable(id="jobs-table", zebra_stripes=True)
                     table.cursor_type = "row"
-                    table.add_columns("JobID", "Name", "Added")
                     yield table
 
                 with TabPane("Scripts", id="scripts-tab"):
                     table = DataTable(id="scripts-table", zebra_stripes=True)
                     table.cursor_type = "row"
-                    table.add_columns("Name", "Path", "Added")
                     yield table
 
             with Horizontal(classes="bookmark-actions"):
@@ -120,24 +131,51 @@ class BookmarksScreen(ModalScreen):
                 yield Button("Close", variant="default", id="close")
 
     def on_mount(self) -> None:
-        """Load bookmarks on mount."""
+        """Set up table columns (runs once for the installed screen)."""
+        self.query_one("#jobs-table", DataTable).add_columns("JobID", "Name", "Added")
+        self.query_one("#scripts-table", DataTable).add_columns("Name", "Path", "Added")
+
+    def on_screen_resume(self) -> None:
+        """Sync tables each time the screen is shown."""
         self._refresh_tables()
 
     def _refresh_tables(self) -> None:
-        """Refresh bookmark tables."""
-        # Jobs table
-        jobs_table = self.query_one("#jobs-table", DataTable)
-        jobs_table.clear()
-
-        for job in self.bookmark_manager.get_jobs():
-            jobs_table.add_row(job.job_id, job.name, job.added)
-
-        # Scripts table
-        scripts_table = self.query_one("#scripts-table", DataTable)
-        scripts_table.clear()
+        """Sync bookmark tables with the manager, touching only changed rows."""
+        jobs = self.bookmark_manager.get_jobs()
+        self._sync_table(
+            self.query_one("#jobs-table", DataTable),
+            [job.job_id for job in self._jobs_cache],
+            {job.job_id: (job.job_id, job.name, job.added) for job in jobs},
+        )
+        self._jobs_cache = jobs
 
-        for script in self.bookmark_manager.get_scripts():
-            scripts_table.add_row(script.name, script.path, script.added)
+        scripts = self.bookmark_manager.get_scripts()
+        self._sync_table(
+            self.query_one("#scripts-table", DataTable),
+            [s.path for s in self._scripts_cache],
+            {s.path: (s.name, s.path, s.added) for s in scripts},
+        )
+        self._scripts_cache = scripts
+
+    @staticmethod
+    def _sync_table(
+        table: DataTable,
+        shown: list[str],
+        rows: dict[str, tuple[str, str, str]],
+    ) -> None:
+        """Remove stale rows and append new ones.
+
+        Bookmarks are only ever appended or removed, so the table order stays
+        in sync with the manager without re-adding existing rows.
+        """
+        for key in shown:
+            if key not in rows:
+                table.remove_row(key)
+
+        present = set(shown)
+        for key, cells in rows.items():
+            if key not in present:
+                table.add_row(*cells, key=key)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -171,14 +209,14 @@ class BookmarksScreen(ModalScreen):
             self.notify("No job selected", severity="warning")
             return
 
-        jobs = self.bookmark_manager.get_jobs()
-        if table.cursor_row >= len(jobs):
+        if table.cursor_row >= len(self._jobs_cache):
             return
 
-        job = jobs[table.cursor_row]
+        job = self._jobs_cache[table.cursor_row]
         self.bookmark_manager.remove_job(job.job_id)
-        self._refresh_tables()
-        self.notify(f"Removed bookmark for job {job.job_id}")
+        self._jobs_cache = self.bookmark_manager.get_jobs()
+        table.remove_row(job.job_id)
+        self._notify_removed(f"job {job.job_id}")
 
     def _delete_selected_script(self) -> None:
         """Delete selected script bookmark."""
@@ -188,14 +226,29 @@ class BookmarksScreen(ModalScreen):
             self.notify("No script selected", severity="warning")
             return
 
-        scripts = self.bookmark_manager.get_scripts()
-        if table.cursor_row >= len(scripts):
+        if table.cursor_row >= len(self._scripts_cache):
             return
 
-        script = scripts[table.cursor_row]
+        script = self._scripts_cache[table.cursor_row]
         self.bookmark_manager.remove_script(script.path)
-        self._refresh_tables()
-        self.notify(f"Removed bookmark for {script.name}")
+        self._scripts_cache = self.bookmark_manager.get_scripts()
+        table.remove_row(script.path)
+        self._notify_removed(script.name)
+
+    def _notify_removed(self, label: str) -> None:
+        """Queue a removal toast so rapid deletes produce a single summary."""
+        self._pending_removals.append(label)
+        if self._removal_timer is None:
+            self._removal_timer = self.set_timer(0.3, self._flush_removals)
+
+    def _flush_removals(self) -> None:
+        """Emit one toast for all removals queued since the last flush."""
+        self._removal_timer = None
+        removed, self._pending_removals = self._pending_removals, []
+        if len(removed) == 1:
+            self.notify(f"Removed bookmark for {removed[0]}")
+        elif removed:
+            self.notify(f"Removed {len(removed)} bookmarks")
 
     def action_edit(self) -> None:
         """Open selected script in editor."""
@@ -212,12 +265,10 @@ class BookmarksScreen(ModalScreen):
             self.notify("No script selected", severity="warning")
             return
 
-        scripts = self.bookmark_manager.get_scripts()
-        if table.cursor_row >= len(scripts):
+        if table.cursor_row >= len(self._scripts_cache):
             return
 
-        script = scripts[table.cursor_row]
+        script = self._scripts_cache[table.cursor_row]
 
         # Open editor with the script
-        from .editor import EditorScreen
         self.app.push_screen(EditorScreen(script.path))
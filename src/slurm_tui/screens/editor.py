@@ -2,19 +2,59 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
-from pathlib import Path
-from glob import glob
+from functools import lru_cache
+from pathlib import Path, PurePath
 
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.reactive import reactive
 from textual.screen import Screen
 from textual.widgets import Static, TextArea, Button, Input, ListView, ListItem, Label
+from textual.worker import get_current_worker
 
 from ..utils.bookmarks import BookmarkManager
 
 
+# Separator rules, built once rather than on every compose
+_SIDEBAR_SEPARATOR = "─" * 28
+_EDITOR_SEPARATOR = "─" * 60
+
+# Suffixes listed in the sidebar as job scripts
+_SLURM_EXTS = (".slurm", ".sh", ".sbatch")
+
+# Files above this size are read in chunks with a progress label so a slow
+# shared filesystem shows movement instead of an apparently frozen editor.
+_CHUNKED_LOAD_BYTES = 256 * 1024
+_READ_CHUNK_CHARS = 64 * 1024
+
+# TextArea builds its whole document in one pass and we hold the text twice
+# while loading it; anything this big is a log opened by mistake, not a
+# script, so refuse rather than hang.
+_MAX_EDIT_BYTES = 2 * 1024 * 1024
+
+
+def _digest(text: str) -> bytes:
+    """Short content fingerprint used to detect edits against the saved text."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+@lru_cache(maxsize=8)
+def _read_cached(path: str, mtime_ns: int, size: int, inode: int) -> str:
+    """Read a small file, memoized on its stat identity for quick reopens.
+
+    mtime alone is too coarse on NFS and similar filesystems to notice an
+    external edit within the same tick; size and inode catch most of those.
+
+    Only files up to _CHUNKED_LOAD_BYTES go through here, which bounds the
+    cache at a couple of MB.
+    """
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
 class EditorScreen(Screen):
     """Screen for editing SLURM scripts."""
 
@@ -170,20 +210,40 @@ class EditorScreen(Screen):
     def __init__(self, file_path: str | None = None):
         super().__init__()
         self._initial_file = file_path
-        self._original_content = ""
-        self.bookmark_manager = BookmarkManager()
+        # Length + digest of the text as last loaded/saved — avoids keeping a
+        # second full copy. Checked once per clean -> dirty transition
+        # (debounced), never per keystroke.
+        self._original_len = 0
+        self._original_hash = _digest("")
+        self._modified_timer = None
         self._browse_dir = os.getcwd()
+        # (dir, dir mtime_ns) -> sorted script paths; creating or deleting a
+        # file bumps the directory mtime, which naturally invalidates it.
+        self._files_cache: dict[tuple[str, int], list[str]] = {}
+
+        # Widget refs resolved once in on_mount (hot paths run per keystroke)
+        self._editor: TextArea | None = None
+        self._filename_label: Static | None = None
+        self._modified_indicator: Static | None = None
+        self._file_input: Input | None = None
+        self._bookmarks_list: ListView | None = None
+        self._files_list: ListView | None = None
+
+    @property
+    def bookmark_manager(self) -> BookmarkManager:
+        """Bookmark store shared across screens via the app."""
+        return self.app.bookmark_manager
 
     def compose(self) -> ComposeResult:
         # Sidebar
         with Vertical(id="sidebar"):
             yield Static("Files", classes="sidebar-title")
-            yield Static("─" * 28, classes="separator")
+            yield Static(_SIDEBAR_SEPARATOR, classes="separator")
 
             yield Static("★ Bookmarks", classes="section-title")
             yield ListView(id="bookmarks-list")
 
-            yield Static("─" * 28, classes="separator")
+            yield Static(_SIDEBAR_SEPARATOR, classes="separator")
             yield Static("📁 Current Dir", classes="section-title")
             yield ListView(id="files-list")
 
@@ -193,7 +253,7 @@ class EditorScreen(Screen):
                 yield Static("No file open", id="filename", classes="filename")
                 yield Static("", id="modified-indicator", classes="modified")
 
-            yield Static("─" * 60, classes="separator")
+            yield Static(_EDITOR_SEPARATOR, classes="separator")
 
             with Horizontal(classes="file-picker"):
                 yield Input(placeholder="Enter file path...", id="file-input")
@@ -207,143 +267,237 @@ class EditorScreen(Screen):
                 yield Button("Close", variant="default", id="close")
 
     def on_mount(self) -> None:
-        """Load initial file if provided."""
+        """Cache widget refs and load initial file if provided."""
+        self._editor = self.query_one("#editor", TextArea)
+        self._filename_label = self.query_one("#filename", Static)
+        self._modified_indicator = self.query_one("#modified-indicator", Static)
+        self._file_input = self.query_one("#file-input", Input)
+        self._bookmarks_list = self.query_one("#bookmarks-list", ListView)
+        self._files_list = self.query_one("#files-list", ListView)
+
         self._refresh_sidebar()
 
         if self._initial_file:
             self._load_file(self._initial_file)
-            self.query_one("#file-input", Input).value = self._initial_file
+            self._file_input.value = self._initial_file
 
     def _refresh_sidebar(self) -> None:
-        """Refresh sidebar lists."""
-        self._refresh_bookmarks()
-        self._refresh_files()
+        """Refresh sidebar lists (repainted together in one batch)."""
+        with self.app.batch_update():
+            self._refresh_bookmarks()
+            self._refresh_files()
 
     def _refresh_bookmarks(self) -> None:
         """Refresh bookmarks list."""
-        bookmarks_list = self.query_one("#bookmarks-list", ListView)
-        bookmarks_list.clear()
-
-        scripts = self.bookmark_manager.get_scripts()
-        if scripts:
-            for script in scripts:
-                item = ListItem(
-                    Static(f"★ {script.name}", classes="bookmark-item"),
-                    id=f"bm-{script.name}",
-                )
-                item._script_path = script.path  # Store path for later
-                bookmarks_list.append(item)
-        else:
-            bookmarks_list.append(ListItem(Static("No bookmarks", classes="no-items")))
+        items = []
+        for script in self.bookmark_manager.get_scripts():
+            # No id: names may contain dots and nothing looks items up by id
+            item = ListItem(Static(f"★ {script.name}", classes="bookmark-item"))
+            item._script_path = script.path  # Store path for later
+            items.append(item)
+        if not items:
+            items.append(ListItem(Static("No bookmarks", classes="no-items")))
+
+        with self.app.batch_update():
+            self._bookmarks_list.clear()
+            self._bookmarks_list.extend(items)
 
     def _refresh_files(self) -> None:
         """Refresh files list from current directory."""
-        files_list = self.query_one("#files-list", ListView)
-        files_list.clear()
-
-        # Find SLURM scripts in current directory
-        patterns = ["*.slurm", "*.sh", "*.sbatch"]
-        files = []
-        for pattern in patterns:
-            files.extend(glob(os.path.join(self._browse_dir, pattern)))
+        items = []
+        for file_path in self._list_scripts(self._browse_dir)[:20]:  # Limit to 20 files
+            item = ListItem(Static(f"  {os.path.basename(file_path)}", classes="file-item"))
+            item._script_path = file_path
+            items.append(item)
+        if not items:
+            items.append(ListItem(Static("No scripts found", classes="no-items")))
+
+        with self.app.batch_update():
+            self._files_list.clear()
+            self._files_list.extend(items)
+
+    def _list_scripts(self, directory: str) -> list[str]:
+        """Return sorted SLURM script paths in *directory*, memoized on mtime."""
+        try:
+            key = (directory, os.stat(directory).st_mtime_ns)
+        except OSError:
+            return []
 
-        files = sorted(set(files))  # Remove duplicates and sort
+        cached = self._files_cache.get(key)
+        if cached is not None:
+            return cached
 
-        if files:
-            for file_path in files[:20]:  # Limit to 20 files
-                name = os.path.basename(file_path)
-                item = ListItem(
-                    Static(f"  {name}", classes="file-item"),
-                    id=f"file-{name}",
-                )
-                item._script_path = file_path
-                files_list.append(item)
-        else:
-            files_list.append(ListItem(Static("No scripts found", classes="no-items")))
+        # One readdir pass instead of a glob per extension (each glob
+        # re-lists the directory).
+        files = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (
+                        name.endswith(_SLURM_EXTS)
+                        and not name.startswith(".")
+                        and entry.is_file()
+                    ):
+                        files.append(entry.path)
+        except OSError:
+            return []
+
+        files.sort()
+
+        if len(self._files_cache) >= 8:
+            # FIFO eviction — dicts keep insertion order
+            del self._files_cache[next(iter(self._files_cache))]
+        self._files_cache[key] = files
+        return files
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle file selection from sidebar."""
         item = event.item
         if hasattr(item, "_script_path"):
             self._load_file(item._script_path)
-            self.query_one("#file-input", Input).value = item._script_path
+            self._file_input.value = item._script_path
 
-    def _load_file(self, path: str) -> bool:
-        """Load a file into the editor."""
-        try:
-            path = os.path.abspath(path)
+    @work(thread=True, exclusive=True, group="load_file")
+    def _load_file(self, path: str) -> None:
+        """Read a file in a background thread, then load it into the editor.
 
-            if not os.path.exists(path):
-                self.notify(f"File not found: {path}", severity="error")
-                return False
+        Scripts often live on NFS/Lustre where a read can stall for a while,
+        so the event loop only sees the finished content.
+        """
+        worker = get_current_worker()
+        p = Path(path).expanduser().resolve()
+        path = str(p)
 
-            with open(path) as f:
-                content = f.read()
-
-            editor = self.query_one("#editor", TextArea)
-            editor.load_text(content)
+        # EAFP: one stat() yields size and mtime (the cache key); a missing
+        # file surfaces as FileNotFoundError instead of a separate exists().
+        try:
+            st = p.stat()
+            size = st.st_size
+            if size > _MAX_EDIT_BYTES:
+                self.app.call_from_thread(
+                    self.notify,
+                    f"File too large to edit ({size // (1024 * 1024)} MB, "
+                    f"limit {_MAX_EDIT_BYTES // (1024 * 1024)} MB)",
+                    severity="error",
+                )
+                return
 
+            if size <= _CHUNKED_LOAD_BYTES:
+                content = _read_cached(path, st.st_mtime_ns, size, st.st_ino)
+            else:
+                # Buffer sized to the chunk so each read() is one syscall
+                with p.open(encoding="utf-8", buffering=_READ_CHUNK_CHARS) as f:
+                    name = p.name
+                    parts: list[str] = []
+                    done = 0
+                    while chunk := f.read(_READ_CHUNK_CHARS):
+                        if worker.is_cancelled:
+                            return
+                        parts.append(chunk)
+                        done += len(chunk)
+                        self.app.call_from_thread(
+                            self._filename_label.update,
+                            f"Loading {name}… {min(done * 100 // size, 100)}%",
+                        )
+                    content = "".join(parts)
+        except FileNotFoundError:
+            self.app.call_from_thread(self.notify, f"File not found: {path}", severity="error")
+            return
+        except Exception as e:
+            self.app.call_from_thread(self.notify, f"Error loading file: {e}", severity="error")
+            return
+
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._apply_loaded_file, path, content, _digest(content))
+
+    def _apply_loaded_file(self, path: str, content: str, digest: bytes) -> None:
+        """Show freshly read file content (runs on main thread)."""
+        name = PurePath(path).name
+        # One repaint for text, reactives and label instead of one each
+        with self.app.batch_update():
+            self._editor.load_text(content)
+            self._original_len = len(content)
+            self._original_hash = digest
             self.current_file = path
-            self._original_content = content
             self.modified = False
+            self._filename_label.update(name)
 
-            # Update UI
-            filename_label = self.query_one("#filename", Static)
-            filename_label.update(f"{os.path.basename(path)}")
+        self.notify(f"Loaded: {name}")
 
-            self.notify(f"Loaded: {os.path.basename(path)}")
-            return True
-
-        except Exception as e:
-            self.notify(f"Error loading file: {e}", severity="error")
-            return False
-
-    def _save_file(self, path: str | None = None) -> bool:
+    def _save_file(self, path: str | None = None) -> None:
         """Save the editor content to a file."""
         if path is None:
             path = self.current_file
 
         if path is None:
             self.notify("No file specified", severity="error")
-            return False
-
-        try:
-            path = os.path.abspath(path)
-            editor = self.query_one("#editor", TextArea)
-            content = editor.text
+            return
 
-            with open(path, "w") as f:
-                f.write(content)
+        self._write_file(Path(path).expanduser().resolve(), self._editor.text)
 
+    @work(thread=True, exclusive=True, group="save_file")
+    def _write_file(self, path: Path, content: str) -> None:
+        """Write editor content in a background thread."""
+        try:
+            created = not path.exists()
+            # Encode once and write bytes: no text-layer newline translation
+            # (job scripts want LF) and no dependence on the locale encoding.
+            path.write_bytes(content.encode("utf-8"))
+        except Exception as e:
+            self.app.call_from_thread(self.notify, f"Error saving file: {e}", severity="error")
+            return
+        finally:
+            # Coarse mtime resolution could otherwise serve the pre-save text
+            _read_cached.cache_clear()
+
+        self.app.call_from_thread(
+            self._apply_saved_file, str(path), len(content), _digest(content), created
+        )
+
+    def _apply_saved_file(self, path: str, length: int, digest: bytes, created: bool) -> None:
+        """Update editor state after a successful save (runs on main thread)."""
+        name = PurePath(path).name
+        with self.app.batch_update():
+            self._original_len = length
+            self._original_hash = digest
             self.current_file = path
-            self._original_content = content
-            self.modified = False
-
-            # Update UI
-            filename_label = self.query_one("#filename", Static)
-            filename_label.update(f"{os.path.basename(path)}")
+            # Edits typed while the write was in flight keep the buffer dirty
+            text = self._editor.text
+            self.modified = len(text) != length or _digest(text) != digest
+            self._filename_label.update(name)
+            if created:
+                self._refresh_files()
 
-            self.notify(f"Saved: {os.path.basename(path)}")
-            self._refresh_files()  # Refresh in case new file was created
-            return True
-
-        except Exception as e:
-            self.notify(f"Error saving file: {e}", severity="error")
-            return False
+        self.notify(f"Saved: {name}")
 
     def watch_modified(self, modified: bool) -> None:
         """Update modified indicator."""
-        indicator = self.query_one("#modified-indicator", Static)
+        indicator = self._modified_indicator
+        if indicator is None:
+            return
         if modified:
             indicator.update("[modified]")
         else:
             indicator.update("")
 
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
-        """Track modifications."""
-        if event.text_area.id == "editor":
-            editor = self.query_one("#editor", TextArea)
-            self.modified = editor.text != self._original_content
+        """Schedule a modified check; once dirty, edits cost nothing."""
+        if event.text_area is not self._editor or self.modified:
+            return
+        # Debounce: a burst of keystrokes (or the Changed posted by
+        # load_text) results in a single comparison.
+        if self._modified_timer is not None:
+            self._modified_timer.stop()
+        self._modified_timer = self.set_timer(0.15, self._check_modified)
+
+    def _check_modified(self) -> None:
+        """Compare against the saved text; stays dirty until load/save."""
+        self._modified_timer = None
+        text = self._editor.text
+        # Length differs for nearly every real edit — skip hashing then
+        if len(text) != self._original_len or _digest(text) != self._original_hash:
+            self.modified = True
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -358,8 +512,7 @@ class EditorScreen(Screen):
 
     def _open_from_input(self) -> None:
         """Open file from input field."""
-        file_input = self.query_one("#file-input", Input)
-        path = file_input.value.strip()
+        path = self._file_input.value.strip()
 
         if path:
             self._load_file(path)
@@ -381,8 +534,7 @@ class EditorScreen(Screen):
             self._save_file()
         else:
             # Save to input path
-            file_input = self.query_one("#file-input", Input)
-            path = file_input.value.strip()
+            path = self._file_input.value.strip()
             if path:
                 self._save_file(path)
             else:
@@ -396,8 +548,7 @@ class EditorScreen(Screen):
 
     def action_open_file(self) -> None:
         """Focus the file input."""
-        file_input = self.query_one("#file-input", Input)
-        file_input.focus()
+        self._file_input.focus()
 
     def action_refresh_sidebar(self) -> None:
         """Refresh the sidebar."""
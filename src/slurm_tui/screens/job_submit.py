@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
-from pathlib import Path
+from functools import lru_cache
 
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal
 from textual.screen import ModalScreen
@@ -16,59 +18,110 @@ from textual.widgets import (
     Label,
 )
 
-from ..utils.slurm import SlurmClient, Job
+from ..utils.slurm import SlurmClient, Job, get_slurm_client
 
 
-class JobSubmitScreen(ModalScreen):
-    """Modal screen for submitting a new job."""
+# Separator rules, built once rather than on every modal compose
+_FORM_SEPARATOR = "─" * 56
+_DIALOG_SEPARATOR = "─" * 46
+
+# Fallback partition choices for the submit and interactive session forms,
+# replaced by the cluster's own list from sinfo once it arrives
+_PARTITIONS = (
+    ("p0", "p0"),
+    ("p1", "p1"),
+    ("p2", "p2"),
+    ("p4", "p4"),
+)
+
+
+def _set_partition_options(select: Select, partitions: list[str]) -> None:
+    """Swap in the cluster's partitions, keeping the selection when it exists."""
+    current = select.value
+    select.set_options([(p, p) for p in partitions])
+    if current in partitions:
+        select.value = current
+
+
+def _safe_int(value: str, default: int) -> int:
+    """Parse a non-negative count from a form field, falling back to *default*."""
+    try:
+        number = int(value)
+    except ValueError:
+        return default
+    return number if number >= 0 else default
+
+
+@lru_cache(maxsize=64)
+def _interactive_command(
+    client: SlurmClient, partition: str, gpus: int, cpus: int, memory: str
+) -> tuple[str, ...]:
+    """Memoized srun command; the preview rebuilds it on every form edit."""
+    return tuple(
+        client.start_interactive_session(
+            partition=partition, gpus=gpus, cpus=cpus, memory=memory
+        )
+    )
+
+
+class DialogScreen(ModalScreen):
+    """Base for the job dialogs: shared layout and form styling."""
 
     DEFAULT_CSS = """
-    JobSubmitScreen {
+    DialogScreen {
         align: center middle;
         background: rgba(26, 27, 38, 0.9);
     }
 
-    JobSubmitScreen > Vertical {
-        width: 60;
+    DialogScreen > Vertical {
+        width: 50;
         height: auto;
         background: #1a1b26;
         padding: 1 2;
     }
 
-    JobSubmitScreen .title {
+    DialogScreen .title {
         text-style: bold;
         text-align: center;
         color: #7aa2f7;
         padding: 0 0 1 0;
     }
 
-    JobSubmitScreen .separator {
+    DialogScreen .separator {
         color: #414868;
         margin-bottom: 1;
     }
 
-    JobSubmitScreen .field-label {
+    DialogScreen .field-label {
         margin-top: 1;
         color: #565f89;
     }
 
-    JobSubmitScreen Input {
+    DialogScreen Input {
         margin-bottom: 1;
         background: #1e2030;
         border: none;
     }
 
-    JobSubmitScreen Input:focus {
+    DialogScreen Input:focus {
         background: #24283b;
     }
 
-    JobSubmitScreen Select {
+    DialogScreen Select {
         margin-bottom: 1;
         background: #1e2030;
         border: none;
     }
 
-    JobSubmitScreen .buttons {
+    DialogScreen .job-info {
+        text-align: center;
+        padding: 1;
+        background: #1e2030;
+        margin: 1 0;
+        color: #565f89;
+    }
+
+    DialogScreen .buttons {
         layout: horizontal;
         align: center middle;
         height: auto;
@@ -76,35 +129,40 @@ class JobSubmitScreen(ModalScreen):
         padding-top: 1;
     }
 
-    JobSubmitScreen .buttons Button {
+    DialogScreen .buttons Button {
         margin: 0 1;
     }
     """
 
+
+class JobSubmitScreen(DialogScreen):
+    """Modal screen for submitting a new job."""
+
+    DEFAULT_CSS = """
+    JobSubmitScreen > Vertical {
+        width: 60;
+    }
+    """
+
     BINDINGS = [
         ("escape", "cancel", "Cancel"),
     ]
 
     def __init__(self):
         super().__init__()
-        self.slurm_client = SlurmClient()
+        self.slurm_client = get_slurm_client()
 
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Static("Submit SLURM Job", classes="title")
-            yield Static("─" * 56, classes="separator")
+            yield Static(_FORM_SEPARATOR, classes="separator")
 
             yield Label("Script Path:", classes="field-label")
             yield Input(placeholder="/path/to/script.slurm", id="script-path")
 
             yield Label("Partition:", classes="field-label")
             yield Select(
-                [
-                    ("p0", "p0"),
-                    ("p1", "p1"),
-                    ("p2", "p2"),
-                    ("p4", "p4"),
-                ],
+                _PARTITIONS,
                 value="p2",
                 id="partition",
             )
@@ -118,12 +176,25 @@ class JobSubmitScreen(ModalScreen):
             yield Label("Memory per CPU:", classes="field-label")
             yield Input(value="10G", id="memory")
 
-            yield Static("─" * 56, classes="separator")
+            yield Static(_FORM_SEPARATOR, classes="separator")
 
             with Horizontal(classes="buttons"):
                 yield Button("Cancel", variant="default", id="cancel")
                 yield Button("Submit", variant="primary", id="submit")
 
+    def on_mount(self) -> None:
+        self._load_partitions()
+
+    @work(thread=True, exclusive=True, group="partitions")
+    def _load_partitions(self) -> None:
+        """Fetch partitions in a background thread (sinfo runs once per client)."""
+        partitions = self.slurm_client.get_available_partitions()
+        if partitions:
+            self.app.call_from_thread(self._apply_partitions, partitions)
+
+    def _apply_partitions(self, partitions: list[str]) -> None:
+        _set_partition_options(self.query_one("#partition", Select), partitions)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel":
             self.app.pop_screen()
@@ -131,87 +202,57 @@ class JobSubmitScreen(ModalScreen):
             self._submit_job()
 
     def _submit_job(self) -> None:
+        submit_button = self.query_one("#submit", Button)
+        if submit_button.disabled:
+            return  # A submission is already in flight
+
         script_path = self.query_one("#script-path", Input).value
 
         if not script_path:
             self.notify("Please enter a script path", severity="error")
             return
 
-        if not Path(script_path).exists():
-            self.notify(f"Script not found: {script_path}", severity="error")
-            return
+        submit_button.disabled = True
+        self._run_submit(script_path)
 
+    @work(thread=True, exclusive=True, group="slurm")
+    def _run_submit(self, script_path: str) -> None:
+        """Check the script and run sbatch in a background thread."""
+        # Even the stat can stall on a busy shared filesystem
+        if not os.path.isfile(script_path):
+            self.app.call_from_thread(
+                self._apply_submit_result, False, f"Script not found: {script_path}"
+            )
+            return
         success, message = self.slurm_client.submit_job(script_path)
+        self.app.call_from_thread(self._apply_submit_result, success, message)
 
+    def _apply_submit_result(self, success: bool, message: str) -> None:
+        """Report the sbatch result (runs on main thread)."""
         if success:
             self.notify(message, severity="information")
-            self.app.pop_screen()
+            if self.is_current:
+                self.app.pop_screen()
         else:
             self.notify(f"Failed: {message}", severity="error")
+            # The dialog may have been dismissed while sbatch ran
+            if self.is_attached:
+                self.query_one("#submit", Button).disabled = False
 
     def action_cancel(self) -> None:
         self.app.pop_screen()
 
 
-class InteractiveSessionScreen(ModalScreen):
+class InteractiveSessionScreen(DialogScreen):
     """Modal screen for starting an interactive session."""
 
     DEFAULT_CSS = """
-    InteractiveSessionScreen {
-        align: center middle;
-        background: rgba(26, 27, 38, 0.9);
-    }
-
     InteractiveSessionScreen > Vertical {
         width: 60;
-        height: auto;
-        background: #1a1b26;
-        padding: 1 2;
     }
 
     InteractiveSessionScreen .title {
-        text-style: bold;
-        text-align: center;
         color: #bb9af7;
-        padding: 0 0 1 0;
-    }
-
-    InteractiveSessionScreen .separator {
-        color: #414868;
-        margin-bottom: 1;
-    }
-
-    InteractiveSessionScreen .field-label {
-        margin-top: 1;
-        color: #565f89;
-    }
-
-    InteractiveSessionScreen Input {
-        margin-bottom: 1;
-        background: #1e2030;
-        border: none;
-    }
-
-    InteractiveSessionScreen Input:focus {
-        background: #24283b;
-    }
-
-    InteractiveSessionScreen Select {
-        margin-bottom: 1;
-        background: #1e2030;
-        border: none;
-    }
-
-    InteractiveSessionScreen .buttons {
-        layout: horizontal;
-        align: center middle;
-        height: auto;
-        margin-top: 1;
-        padding-top: 1;
-    }
-
-    InteractiveSessionScreen .buttons Button {
-        margin: 0 1;
     }
 
     InteractiveSessionScreen .command-preview {
@@ -228,21 +269,23 @@ class InteractiveSessionScreen(ModalScreen):
 
     def __init__(self):
         super().__init__()
-        self.slurm_client = SlurmClient()
+        self.slurm_client = get_slurm_client()
+        # Widget refs resolved once in on_mount (preview updates per keystroke)
+        self._partition_select: Select | None = None
+        self._gpus_input: Input | None = None
+        self._cpus_input: Input | None = None
+        self._memory_input: Input | None = None
+        self._preview: Static | None = None
+        self._preview_timer = None
 
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Static("Interactive SLURM Session", classes="title")
-            yield Static("─" * 56, classes="separator")
+            yield Static(_FORM_SEPARATOR, classes="separator")
 
             yield Label("Partition:", classes="field-label")
             yield Select(
-                [
-                    ("p0", "p0"),
-                    ("p1", "p1"),
-                    ("p2", "p2"),
-                    ("p4", "p4"),
-                ],
+                _PARTITIONS,
                 value="p2",
                 id="partition",
             )
@@ -258,14 +301,30 @@ class InteractiveSessionScreen(ModalScreen):
 
             yield Static("", id="command-preview", classes="command-preview")
 
-            yield Static("─" * 56, classes="separator")
+            yield Static(_FORM_SEPARATOR, classes="separator")
 
             with Horizontal(classes="buttons"):
                 yield Button("Cancel", variant="default", id="cancel")
                 yield Button("Start", variant="primary", id="start")
 
     def on_mount(self) -> None:
-        self._update_preview()
+        self._partition_select = self.query_one("#partition", Select)
+        self._gpus_input = self.query_one("#gpus", Input)
+        self._cpus_input = self.query_one("#cpus", Input)
+        self._memory_input = self.query_one("#memory", Input)
+        self._preview = self.query_one("#command-preview", Static)
+        self._do_update_preview()
+        self._load_partitions()
+
+    @work(thread=True, exclusive=True, group="partitions")
+    def _load_partitions(self) -> None:
+        """Fetch partitions in a background thread (sinfo runs once per client)."""
+        partitions = self.slurm_client.get_available_partitions()
+        if partitions:
+            self.app.call_from_thread(self._apply_partitions, partitions)
+
+    def _apply_partitions(self, partitions: list[str]) -> None:
+        _set_partition_options(self._partition_select, partitions)
 
     def on_input_changed(self, event: Input.Changed) -> None:
         self._update_preview()
@@ -274,20 +333,24 @@ class InteractiveSessionScreen(ModalScreen):
         self._update_preview()
 
     def _update_preview(self) -> None:
-        partition = self.query_one("#partition", Select).value or "p2"
-        gpus = self.query_one("#gpus", Input).value or "1"
-        cpus = self.query_one("#cpus", Input).value or "4"
-        memory = self.query_one("#memory", Input).value or "4G"
-
-        cmd = self.slurm_client.start_interactive_session(
-            partition=str(partition),
-            gpus=int(gpus) if gpus.isdigit() else 1,
-            cpus=int(cpus) if cpus.isdigit() else 4,
-            memory=memory,
+        """Schedule a preview refresh; a burst of keystrokes renders once."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._preview_timer = self.set_timer(0.12, self._do_update_preview)
+
+    def _session_command(self) -> tuple[str, ...]:
+        """srun command for the current form values."""
+        return _interactive_command(
+            self.slurm_client,
+            str(self._partition_select.value or "p2"),
+            _safe_int(self._gpus_input.value, 1),
+            _safe_int(self._cpus_input.value, 4),
+            self._memory_input.value or "4G",
         )
 
-        preview = self.query_one("#command-preview", Static)
-        preview.update(f"$ {' '.join(cmd)}")
+    def _do_update_preview(self) -> None:
+        self._preview_timer = None
+        self._preview.update(f"$ {' '.join(self._session_command())}")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel":
@@ -296,17 +359,7 @@ class InteractiveSessionScreen(ModalScreen):
             self._start_session()
 
     def _start_session(self) -> None:
-        partition = self.query_one("#partition", Select).value or "p2"
-        gpus = self.query_one("#gpus", Input).value or "1"
-        cpus = self.query_one("#cpus", Input).value or "4"
-        memory = self.query_one("#memory", Input).value or "4G"
-
-        cmd = self.slurm_client.start_interactive_session(
-            partition=str(partition),
-            gpus=int(gpus) if gpus.isdigit() else 1,
-            cpus=int(cpus) if cpus.isdigit() else 4,
-            memory=memory,
-        )
+        cmd = list(self._session_command())
 
         # Suspend the TUI, run the interactive session, resume on exit
         self.app.pop_screen()
@@ -317,32 +370,12 @@ class InteractiveSessionScreen(ModalScreen):
         self.app.pop_screen()
 
 
-class ConfirmCancelScreen(ModalScreen):
+class ConfirmCancelScreen(DialogScreen):
     """Modal screen to confirm job cancellation."""
 
     DEFAULT_CSS = """
-    ConfirmCancelScreen {
-        align: center middle;
-        background: rgba(26, 27, 38, 0.9);
-    }
-
-    ConfirmCancelScreen > Vertical {
-        width: 50;
-        height: auto;
-        background: #1a1b26;
-        padding: 1 2;
-    }
-
     ConfirmCancelScreen .title {
-        text-style: bold;
-        text-align: center;
         color: #f7768e;
-        padding: 0 0 1 0;
-    }
-
-    ConfirmCancelScreen .separator {
-        color: #414868;
-        margin-bottom: 1;
     }
 
     ConfirmCancelScreen .message {
@@ -350,26 +383,6 @@ class ConfirmCancelScreen(ModalScreen):
         padding: 1;
         color: #c0caf5;
     }
-
-    ConfirmCancelScreen .job-info {
-        text-align: center;
-        padding: 1;
-        background: #1e2030;
-        margin: 1 0;
-        color: #565f89;
-    }
-
-    ConfirmCancelScreen .buttons {
-        layout: horizontal;
-        align: center middle;
-        height: auto;
-        margin-top: 1;
-        padding-top: 1;
-    }
-
-    ConfirmCancelScreen .buttons Button {
-        margin: 0 1;
-    }
     """
 
     BINDINGS = [
@@ -381,26 +394,25 @@ class ConfirmCancelScreen(ModalScreen):
     def __init__(self, jobs: list[Job] | Job):
         super().__init__()
         self.jobs = jobs if isinstance(jobs, list) else [jobs]
-        self.slurm_client = SlurmClient()
+        self.slurm_client = get_slurm_client()
 
-    def compose(self) -> ComposeResult:
+        # Dialog text is fixed for the lifetime of the screen
         count = len(self.jobs)
-        title = f"✗ Cancel {count} Job{'s' if count > 1 else ''}?"
-        msg = f"Are you sure you want to cancel {'these jobs' if count > 1 else 'this job'}?"
-
-        info_lines = []
-        for job in self.jobs:
-            info_lines.append(f"  {job.job_id}  {job.name}  ({job.state})")
-        info_text = "\n".join(info_lines)
+        self._title = f"✗ Cancel {count} Job{'s' if count > 1 else ''}?"
+        self._message = f"Are you sure you want to cancel {'these jobs' if count > 1 else 'this job'}?"
+        self._info_text = "\n".join(
+            f"  {job.job_id}  {job.name}  ({job.state})" for job in self.jobs
+        )
 
+    def compose(self) -> ComposeResult:
         with Vertical():
-            yield Static(title, classes="title")
-            yield Static("─" * 46, classes="separator")
+            yield Static(self._title, classes="title")
+            yield Static(_DIALOG_SEPARATOR, classes="separator")
 
-            yield Static(msg, classes="message")
-            yield Static(info_text, classes="job-info")
+            yield Static(self._message, classes="message")
+            yield Static(self._info_text, classes="job-info")
 
-            yield Static("─" * 46, classes="separator")
+            yield Static(_DIALOG_SEPARATOR, classes="separator")
 
             with Horizontal(classes="buttons"):
                 yield Button("No", variant="default", id="no")
@@ -413,12 +425,24 @@ class ConfirmCancelScreen(ModalScreen):
             self._cancel_job()
 
     def _cancel_job(self) -> None:
+        yes_button = self.query_one("#yes", Button)
+        if yes_button.disabled:
+            return  # Cancellation already in flight
+        yes_button.disabled = True
+        self._run_cancel()
+
+    @work(thread=True, exclusive=True, group="slurm")
+    def _run_cancel(self) -> None:
+        """Run scancel for each job in a background thread."""
         failed = []
         for job in self.jobs:
             success, message = self.slurm_client.cancel_job(job.job_id)
             if not success:
                 failed.append(f"{job.job_id}: {message}")
+        self.app.call_from_thread(self._apply_cancel_result, failed)
 
+    def _apply_cancel_result(self, failed: list[str]) -> None:
+        """Report the scancel results (runs on main thread)."""
         if failed:
             self.notify(f"Failed to cancel: {', '.join(failed)}", severity="error")
         else:
@@ -426,7 +450,8 @@ class ConfirmCancelScreen(ModalScreen):
             ids = ", ".join(j.job_id for j in self.jobs)
             self.notify(f"Cancelled {count} job{'s' if count > 1 else ''}: {ids}", severity="information")
 
-        self.app.pop_screen()
+        if self.is_current:
+            self.app.pop_screen()
 
     def action_cancel(self) -> None:
         self.app.pop_screen()
@@ -435,55 +460,9 @@ class ConfirmCancelScreen(ModalScreen):
         self._cancel_job()
 
 
-class QosUpdateScreen(ModalScreen):
+class QosUpdateScreen(DialogScreen):
     """Modal screen to change QOS of a pending job."""
 
-    DEFAULT_CSS = """
-    QosUpdateScreen {
-        align: center middle;
-        background: rgba(26, 27, 38, 0.9);
-    }
-
-    QosUpdateScreen > Vertical {
-        width: 50;
-        height: auto;
-        background: #1a1b26;
-        padding: 1 2;
-    }
-
-    QosUpdateScreen .title {
-        text-style: bold;
-        text-align: center;
-        color: #7aa2f7;
-        padding: 0 0 1 0;
-    }
-
-    QosUpdateScreen .separator {
-        color: #414868;
-        margin-bottom: 1;
-    }
-
-    QosUpdateScreen .job-info {
-        text-align: center;
-        padding: 1;
-        background: #1e2030;
-        margin: 1 0;
-        color: #565f89;
-    }
-
-    QosUpdateScreen .buttons {
-        layout: horizontal;
-        align: center middle;
-        height: auto;
-        margin-top: 1;
-        padding-top: 1;
-    }
-
-    QosUpdateScreen .buttons Button {
-        margin: 0 1;
-    }
-    """
-
     BINDINGS = [
         ("escape", "dismiss", "Cancel"),
     ]
@@ -503,7 +482,7 @@ class QosUpdateScreen(ModalScreen):
 
         with Vertical():
             yield Static(title, classes="title")
-            yield Static("─" * 46, classes="separator")
+            yield Static(_DIALOG_SEPARATOR, classes="separator")
             yield Static(info_text, classes="job-info")
 
             if self._qos_list:
@@ -512,7 +491,7 @@ class QosUpdateScreen(ModalScreen):
             else:
                 yield Input(placeholder="Enter QOS name", id="qos-input")
 
-            yield Static("─" * 46, classes="separator")
+            yield Static(_DIALOG_SEPARATOR, classes="separator")
             with Horizontal(classes="buttons"):
                 yield Button("Cancel", variant="default", id="cancel")
                 yield Button("Apply", variant="primary", id="apply")
@@ -562,55 +541,9 @@ class QosUpdateScreen(ModalScreen):
         self.app.pop_screen()
 
 
-class PartitionUpdateScreen(ModalScreen):
+class PartitionUpdateScreen(DialogScreen):
     """Modal screen to change partition of a pending job."""
 
-    DEFAULT_CSS = """
-    PartitionUpdateScreen {
-        align: center middle;
-        background: rgba(26, 27, 38, 0.9);
-    }
-
-    PartitionUpdateScreen > Vertical {
-        width: 50;
-        height: auto;
-        background: #1a1b26;
-        padding: 1 2;
-    }
-
-    PartitionUpdateScreen .title {
-        text-style: bold;
-        text-align: center;
-        color: #7aa2f7;
-        padding: 0 0 1 0;
-    }
-
-    PartitionUpdateScreen .separator {
-        color: #414868;
-        margin-bottom: 1;
-    }
-
-    PartitionUpdateScreen .job-info {
-        text-align: center;
-        padding: 1;
-        background: #1e2030;
-        margin: 1 0;
-        color: #565f89;
-    }
-
-    PartitionUpdateScreen .buttons {
-        layout: horizontal;
-        align: center middle;
-        height: auto;
-        margin-top: 1;
-        padding-top: 1;
-    }
-
-    PartitionUpdateScreen .buttons Button {
-        margin: 0 1;
-    }
-    """
-
     BINDINGS = [
         ("escape", "dismiss", "Cancel"),
     ]
@@ -630,7 +563,7 @@ class PartitionUpdateScreen(ModalScreen):
 
         with Vertical():
             yield Static(title, classes="title")
-            yield Static("─" * 46, classes="separator")
+            yield Static(_DIALOG_SEPARATOR, classes="separator")
             yield Static(info_text, classes="job-info")
 
             if self._partition_list:
@@ -639,7 +572,7 @@ class PartitionUpdateScreen(ModalScreen):
             else:
                 yield Input(placeholder="Enter partition name", id="partition-input")
 
-            yield Static("─" * 46, classes="separator")
+            yield Static(_DIALOG_SEPARATOR, classes="separator")
             with Horizontal(classes="buttons"):
                 yield Button("Cancel", variant="default", id="cancel")
                 yield Button("Apply", variant="primary", id="apply")
@@ -11,7 +11,7 @@ from textual.widgets import Static, TextArea, Button, TabbedContent, TabPane
 from textual.worker import get_current_worker
 
 from ..utils.slurm import SlurmClient, Job
-from ..utils.log_reader import LogTail, read_log_incremental
+from ..utils.log_reader import LogTail, append_log_text, read_log_incremental
 
 
 class LogViewerScreen(ModalScreen):
@@ -113,6 +113,12 @@ class LogViewerScreen(ModalScreen):
         self._follow_timer = None
         self._stderr_tail: LogTail | None = None
         self._stdout_tail: LogTail | None = None
+        # Streams ("stderr"/"stdout") whose tab has been loaded, or is being
+        # loaded; the other tab is only read once the user switches to it.
+        self._loaded_streams: set[str] = set()
+        self._pending_streams: set[str] = set()
+        # Text each log view was last loaded with (until follow appends to it)
+        self._loaded_text: dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -136,59 +142,87 @@ class LogViewerScreen(ModalScreen):
                 yield Button("Close", variant="default", id="close")
 
     def on_mount(self) -> None:
-        """Load logs on mount."""
-        self._load_log_paths()
-        self._load_logs()
+        """Load the visible tab on mount (paths and content are resolved in a worker)."""
+        self._request_load(self._active_stream())
+
+    def _active_stream(self) -> str:
+        """Stream shown in the active tab ("stderr" or "stdout")."""
+        return "stdout" if self.query_one(TabbedContent).active == "stdout-tab" else "stderr"
+
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Load a tab's log the first time it is shown."""
+        stream = "stdout" if event.pane.id == "stdout-tab" else "stderr"
+        if stream not in self._loaded_streams and stream not in self._pending_streams:
+            self._request_load(stream)
+
+    def _request_load(self, stream: str) -> None:
+        """Start a full load of *stream*.
+
+        The load worker is exclusive, so a new request cancels the previous
+        one; it therefore also carries every stream still waiting to load.
+        """
+        self._pending_streams.add(stream)
+        self._load_logs(tuple(sorted(self._pending_streams)))
 
     def _load_log_paths(self) -> None:
-        """Get log file paths from SLURM."""
+        """Get log file paths from SLURM (blocking; call from a worker)."""
         self.stdout_path, self.stderr_path = self.slurm_client.get_job_log_paths(
             self.job.job_id
         )
 
-    @work(thread=True, exclusive=True)
-    def _load_logs(self) -> None:
-        """Full load of log files (initial mount + manual refresh)."""
+    @work(thread=True, exclusive=True, group="load_logs")
+    def _load_logs(self, streams: tuple[str, ...]) -> None:
+        """Full load of the given streams (first view of a tab + manual refresh)."""
         worker = get_current_worker()
 
-        # Create fresh LogTail objects for full reload
-        self._stderr_tail = LogTail(self.stderr_path) if self.stderr_path else None
-        self._stdout_tail = LogTail(self.stdout_path) if self.stdout_path else None
-
-        stderr_content = "No stderr log available"
-        if self._stderr_tail:
-            result = read_log_incremental(self._stderr_tail)
-            if result is not None:
-                stderr_content = result
-
-        if worker.is_cancelled:
-            return
-
-        stdout_content = "No stdout log available"
-        if self._stdout_tail:
-            result = read_log_incremental(self._stdout_tail)
-            if result is not None:
-                stdout_content = result
+        # scontrol can be slow on a busy controller, so it runs here too.
+        # Retried on refresh until SLURM reports a path.
+        if self.stdout_path is None and self.stderr_path is None:
+            self._load_log_paths()
+            if worker.is_cancelled:
+                return
 
-        if worker.is_cancelled:
-            return
+        results: dict[str, tuple[LogTail | None, str]] = {}
+        for stream in streams:
+            path = self.stdout_path if stream == "stdout" else self.stderr_path
+            # Fresh LogTail for a full reload
+            log_tail = LogTail(path) if path else None
+            content = f"No {stream} log available"
+            if log_tail:
+                result = read_log_incremental(log_tail)
+                if result is not None:
+                    content = result
+            if worker.is_cancelled:
+                return
+            results[stream] = (log_tail, content)
 
-        self.app.call_from_thread(self._apply_logs, stderr_content, stdout_content)
+        self.app.call_from_thread(self._apply_logs, results)
 
-    def _apply_logs(self, stderr_content: str, stdout_content: str) -> None:
+    def _apply_logs(self, results: dict[str, tuple[LogTail | None, str]]) -> None:
         """Apply full log content on the main thread (load_text + scroll to end)."""
-        try:
-            stderr_log = self.query_one("#stderr-log", TextArea)
-            stderr_log.load_text(stderr_content)
-            stderr_log.scroll_end(animate=False)
+        for stream, (log_tail, content) in results.items():
+            if stream == "stdout":
+                self._stdout_tail = log_tail
+            else:
+                self._stderr_tail = log_tail
+            self._loaded_streams.add(stream)
+            self._pending_streams.discard(stream)
 
-            stdout_log = self.query_one("#stdout-log", TextArea)
-            stdout_log.load_text(stdout_content)
-            stdout_log.scroll_end(animate=False)
+        try:
+            # All loaded tabs repaint once, not once per load_text/scroll
+            with self.app.batch_update():
+                for stream, (_, content) in results.items():
+                    # An unchanged log keeps its document and scroll position
+                    if self._loaded_text.get(stream) == content:
+                        continue
+                    log_area = self.query_one(f"#{stream}-log", TextArea)
+                    log_area.load_text(content)
+                    log_area.scroll_end(animate=False)
+                    self._loaded_text[stream] = content
         except Exception:
             pass
 
-    @work(thread=True, exclusive=True)
+    @work(thread=True, exclusive=True, group="follow")
     def _follow_tick(self) -> None:
         """Incremental follow-mode update — only reads new bytes."""
         worker = get_current_worker()
@@ -215,21 +249,16 @@ class LogViewerScreen(ModalScreen):
             )
 
     def _apply_incremental(self, stderr_new: str, stdout_new: str) -> None:
-        """Append new text to TextAreas; auto-scroll only if already at bottom."""
+        """Append new text to TextAreas (bounded); auto-scroll only if already at bottom."""
         try:
-            if stderr_new:
-                ta = self.query_one("#stderr-log", TextArea)
-                was_at_bottom = ta.scroll_y >= ta.max_scroll_y
-                ta.insert(stderr_new, ta.document.end)
-                if was_at_bottom:
-                    ta.scroll_end(animate=False)
-
-            if stdout_new:
-                ta = self.query_one("#stdout-log", TextArea)
-                was_at_bottom = ta.scroll_y >= ta.max_scroll_y
-                ta.insert(stdout_new, ta.document.end)
-                if was_at_bottom:
-                    ta.scroll_end(animate=False)
+            with self.app.batch_update():
+                if stderr_new:
+                    append_log_text(self.query_one("#stderr-log", TextArea), stderr_new)
+                    self._loaded_text.pop("stderr", None)
+
+                if stdout_new:
+                    append_log_text(self.query_one("#stdout-log", TextArea), stdout_new)
+                    self._loaded_text.pop("stdout", None)
         except Exception:
             pass
 
@@ -238,8 +267,7 @@ class LogViewerScreen(ModalScreen):
         if event.button.id == "close":
             self.app.pop_screen()
         elif event.button.id == "refresh":
-            self._load_logs()
-            self.notify("Logs refreshed")
+            self.action_refresh_logs()
         elif event.button.id == "copy":
             self.action_copy_logs()
         elif event.button.id == "follow":
@@ -294,6 +322,8 @@ class LogViewerScreen(ModalScreen):
             self.notify(f"Copy failed: {e}", severity="error")
 
     def action_refresh_logs(self) -> None:
-        """Refresh log contents."""
-        self._load_logs()
+        """Reload the visible tab; the other one reloads when next shown."""
+        self._loaded_streams.clear()
+        self._pending_streams.clear()
+        self._request_load(self._active_stream())
         self.notify("Logs refreshed")
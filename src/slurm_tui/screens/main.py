@@ -19,6 +19,10 @@ Design decisions:
       their cursor inside the script editor.
     - All data fetching happens in @work(thread=True) workers so the event
       loop is never blocked by subprocess calls.
+    - Polling widgets are driven by a single screen-level tick, pause
+      while another screen is on top and slow down while the terminal is
+      unfocused (see _refresh_tick). The job table additionally backs off
+      while its jobs do not change, until the next keypress.
     - Widget updates use Static.update() / update_cell_at() (imperative)
       instead of recompose() to avoid flicker and preserve scroll position.
 """
@@ -31,13 +35,26 @@ import subprocess
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import Screen
-from textual.widgets import Static
+from textual.widget import Widget
+from textual.widgets import Static, TextArea
 
 from ..widgets import GPUMonitorWidget, GPUHoursWidget, JobTableWidget, JobDetailsWidget, DiskQuotaWidget
-from ..utils.slurm import SlurmClient
-from ..utils.gpu import GPUMonitor
+from ..utils.slurm import get_slurm_client
+from ..utils.gpu import get_gpu_monitor
 from ..utils.quota import QuotaMonitor
 from ..utils.bookmarks import BookmarkManager
+from .editor import EditorScreen
+from .job_submit import (
+    ConfirmCancelScreen,
+    InteractiveSessionScreen,
+    JobSubmitScreen,
+    PartitionUpdateScreen,
+    QosUpdateScreen,
+)
+from .log_viewer import LogViewerScreen
+
+# While the terminal window is unfocused, poll this many times less often.
+_UNFOCUSED_SLOWDOWN = 6
 
 
 class MainScreen(Screen):
@@ -153,10 +170,22 @@ class MainScreen(Screen):
 
     def __init__(self):
         super().__init__()
-        self.slurm_client = SlurmClient()
-        self.gpu_monitor = GPUMonitor()
+        self.slurm_client = get_slurm_client()
+        self.gpu_monitor = get_gpu_monitor()
         self.quota_monitor = QuotaMonitor()
-        self.bookmark_manager = BookmarkManager()
+        # (widget, offset in seconds) polled by _refresh_tick; see on_mount
+        self._refresh_schedule: list[tuple[Widget, int]] = []
+        # Tick of each widget's last refresh; the next one is due
+        # refresh_interval seconds later
+        self._last_refresh: dict[Widget, int] = {}
+        self._refresh_ticks = 0
+        self._stale_widgets: list[Widget] = []
+        self._job_table: JobTableWidget | None = None
+
+    @property
+    def bookmark_manager(self) -> BookmarkManager:
+        """Bookmark store shared across screens via the app."""
+        return self.app.bookmark_manager
 
     def compose(self) -> ComposeResult:
         # App header
@@ -172,20 +201,24 @@ class MainScreen(Screen):
                     yield GPUMonitorWidget(
                         gpu_monitor=self.gpu_monitor,
                         refresh_interval=10.0,
+                        auto_poll=False,
                     )
                     yield GPUHoursWidget(
                         gpu_monitor=self.gpu_monitor,
                         refresh_interval=60.0,
+                        auto_poll=False,
                     )
                     yield DiskQuotaWidget(
                         quota_monitor=self.quota_monitor,
                         refresh_interval=60.0,
+                        auto_poll=False,
                     )
 
                 with Container(id="bottom-panel"):
                     yield JobTableWidget(
                         slurm_client=self.slurm_client,
                         refresh_interval=10.0,
+                        auto_poll=False,
                     )
 
             # Right panel — job details / script / logs
@@ -209,6 +242,70 @@ class MainScreen(Screen):
             classes="keybindings",
         )
 
+    # ── Refresh scheduling ───────────────────────────────────────
+    #
+    # One 1s tick drives every polling widget instead of four independent
+    # timers. The offsets keep the original stagger (job table first,
+    # sreport last); afterwards each widget is due refresh_interval seconds
+    # after its last refresh (times _UNFOCUSED_SLOWDOWN while the terminal
+    # is unfocused). The interval is re-read every tick, so changes such as
+    # the job table's idle back-off apply at once. While another screen
+    # covers the dashboard, due refreshes are only recorded and run once it
+    # is shown again, so a long editor or log session sends no
+    # squeue/sinfo/sreport traffic.
+
+    def on_mount(self) -> None:
+        """Cache the job table and start the shared refresh tick."""
+        self._job_table = self.query_one(JobTableWidget)
+        self._refresh_schedule = [
+            (self._job_table, 0),
+            (self.query_one(GPUMonitorWidget), 1),
+            (self.query_one(GPUHoursWidget), 5),
+            (self.query_one(DiskQuotaWidget), 6),
+        ]
+        self._refresh_tick()
+        self.set_interval(1.0, self._refresh_tick)
+        self.watch(self.app, "app_focus", self._on_app_focus_changed, init=False)
+
+    def _refresh_tick(self) -> None:
+        """Advance the shared clock by one second."""
+        self._refresh_due(self._refresh_ticks)
+        self._refresh_ticks += 1
+
+    def _refresh_due(self, tick: int) -> None:
+        """Refresh each widget whose interval has elapsed by ``tick``."""
+        slowdown = 1 if self.app.app_focus else _UNFOCUSED_SLOWDOWN
+        for widget, offset in self._refresh_schedule:
+            last = self._last_refresh.get(widget)
+            if last is None:
+                due = offset
+            else:
+                due = last + max(1, round(widget.refresh_interval)) * slowdown
+            if tick < due:
+                continue
+            if self.app.screen is self:
+                widget.refresh_data()
+                self._last_refresh[widget] = tick
+            elif widget not in self._stale_widgets:
+                self._stale_widgets.append(widget)
+
+    def _refresh_stale(self) -> None:
+        """Run the refreshes skipped while another screen was on top."""
+        tick = self._refresh_ticks - 1
+        for widget in self._stale_widgets:
+            widget.refresh_data()
+            self._last_refresh[widget] = tick
+        self._stale_widgets.clear()
+
+    def on_screen_resume(self) -> None:
+        """Catch up on refreshes skipped while another screen was on top."""
+        self._refresh_stale()
+
+    def _on_app_focus_changed(self, focused: bool) -> None:
+        """Catch up on slowed-down refreshes once the terminal regains focus."""
+        if focused and self.app.screen is self:
+            self._refresh_due(self._refresh_ticks - 1)
+
     # ── Arrow key handling ───────────────────────────────────────
     #
     # DataTable binds left/right for cursor_left/cursor_right, but in
@@ -219,7 +316,8 @@ class MainScreen(Screen):
 
     def on_key(self, event) -> None:
         """Repurpose arrow left/right for sort-column navigation."""
-        from textual.widgets import TextArea
+        # Someone is at the keyboard: poll jobs at the normal rate again
+        self._job_table.reset_refresh_backoff()
         focused = self.app.focused
         if isinstance(focused, TextArea) and not focused.read_only:
             return
@@ -267,17 +365,21 @@ class MainScreen(Screen):
 
     def action_refresh(self) -> None:
         """Trigger an immediate refresh of all widgets."""
+        self.slurm_client.invalidate_job_cache()
+
+        # An explicit refresh overrides any failure back-off
         gpu_monitor = self.query_one(GPUMonitorWidget)
+        gpu_monitor.reset_backoff()
         gpu_monitor.refresh_data()
 
         gpu_hours = self.query_one(GPUHoursWidget)
+        gpu_hours.reset_backoff()
         gpu_hours.refresh_data()
 
         disk_quota = self.query_one(DiskQuotaWidget)
         disk_quota.refresh_data()
 
-        job_table = self.query_one(JobTableWidget)
-        job_table.refresh_data()
+        self._job_table.refresh_data()
 
         details_panel = self.query_one(JobDetailsWidget)
         details_panel.refresh_logs()
@@ -287,8 +389,7 @@ class MainScreen(Screen):
     def action_sort_column_left(self) -> None:
         """Move to the previous sortable column."""
         try:
-            job_table = self.query_one(JobTableWidget)
-            job_table.move_sort_column(-1)
+            self._job_table.move_sort_column(-1)
             self.notify("← previous sort column")
         except Exception as e:
             self.notify(f"sort_column_left error: {e}", severity="error")
@@ -296,8 +397,7 @@ class MainScreen(Screen):
     def action_sort_column_right(self) -> None:
         """Move to the next sortable column."""
         try:
-            job_table = self.query_one(JobTableWidget)
-            job_table.move_sort_column(1)
+            self._job_table.move_sort_column(1)
             self.notify("→ next sort column")
         except Exception as e:
             self.notify(f"sort_column_right error: {e}", severity="error")
@@ -305,8 +405,7 @@ class MainScreen(Screen):
     def action_sort(self) -> None:
         """Change sorting for the current column."""
         try:
-            job_table = self.query_one(JobTableWidget)
-            job_table.toggle_sort_direction()
+            self._job_table.toggle_sort_direction()
             self.notify("sort updated")
         except Exception as e:
             self.notify(f"sort error: {e}", severity="error")
@@ -314,8 +413,7 @@ class MainScreen(Screen):
     def action_sort_direction(self) -> None:
         """Toggle sort direction for the active sort column."""
         try:
-            job_table = self.query_one(JobTableWidget)
-            job_table.toggle_sort_direction()
+            self._job_table.toggle_sort_direction()
             self.notify("sort direction toggled")
         except Exception as e:
             self.notify(f"sort direction error: {e}", severity="error")
@@ -332,18 +430,15 @@ class MainScreen(Screen):
 
     def action_new_job(self) -> None:
         """Show the new batch job submission dialog."""
-        from .job_submit import JobSubmitScreen
         self.app.push_screen(JobSubmitScreen())
 
     def action_interactive(self) -> None:
         """Show the interactive session dialog."""
-        from .job_submit import InteractiveSessionScreen
         self.app.push_screen(InteractiveSessionScreen())
 
     def action_attach(self) -> None:
         """Attach to selected running job — suspends TUI, resumes on exit."""
-        job_table = self.query_one(JobTableWidget)
-        job = job_table.get_selected_job()
+        job = self._job_table.selected_job
 
         if job is None:
             self.notify("No job selected", severity="warning")
@@ -367,25 +462,21 @@ class MainScreen(Screen):
 
     def action_cancel(self) -> None:
         """Cancel selected job(s) with confirmation dialog."""
-        job_table = self.query_one(JobTableWidget)
-        jobs = job_table.get_selected_jobs()
+        jobs = self._job_table.get_selected_jobs()
 
         if not jobs:
             self.notify("No job selected", severity="warning")
             return
 
-        from .job_submit import ConfirmCancelScreen
         self.app.push_screen(ConfirmCancelScreen(jobs))
 
     def action_toggle_users(self) -> None:
         """Toggle between own jobs and all users' jobs."""
-        job_table = self.query_one(JobTableWidget)
-        job_table.toggle_all_users()
+        self._job_table.toggle_all_users()
 
     def action_gpu_stats(self) -> None:
         """Show live per-GPU stats for the selected running job."""
-        job_table = self.query_one(JobTableWidget)
-        job = job_table.get_selected_job()
+        job = self._job_table.selected_job
 
         if job is None:
             self.notify("No job selected", severity="warning")
@@ -420,8 +511,7 @@ class MainScreen(Screen):
 
     def action_change_qos(self) -> None:
         """Change QOS of pending job(s)."""
-        job_table = self.query_one(JobTableWidget)
-        jobs = job_table.get_selected_jobs()
+        jobs = self._job_table.get_selected_jobs()
 
         if not jobs:
             self.notify("No job selected", severity="warning")
@@ -432,13 +522,11 @@ class MainScreen(Screen):
             self.notify("No pending jobs in selection", severity="warning")
             return
 
-        from .job_submit import QosUpdateScreen
         self.app.push_screen(QosUpdateScreen(pending, self.slurm_client))
 
     def action_change_partition(self) -> None:
         """Change partition of pending job(s)."""
-        job_table = self.query_one(JobTableWidget)
-        jobs = job_table.get_selected_jobs()
+        jobs = self._job_table.get_selected_jobs()
 
         if not jobs:
             self.notify("No job selected", severity="warning")
@@ -449,7 +537,6 @@ class MainScreen(Screen):
             self.notify("No pending jobs in selection", severity="warning")
             return
 
-        from .job_submit import PartitionUpdateScreen
         self.app.push_screen(PartitionUpdateScreen(pending, self.slurm_client))
 
     def action_toggle_quota_visible(self) -> None:
@@ -472,25 +559,21 @@ class MainScreen(Screen):
 
     def action_view_logs(self) -> None:
         """Open full-screen log viewer for the selected job."""
-        job_table = self.query_one(JobTableWidget)
-        job = job_table.get_selected_job()
+        job = self._job_table.selected_job
 
         if job is None:
             self.notify("No job selected", severity="warning")
             return
 
-        from .log_viewer import LogViewerScreen
         self.app.push_screen(LogViewerScreen(job, self.slurm_client))
 
     def action_bookmarks(self) -> None:
-        """Open bookmarks screen."""
-        from .bookmarks import BookmarksScreen
-        self.app.push_screen(BookmarksScreen(self.bookmark_manager))
+        """Open the bookmarks screen (installed once by the app)."""
+        self.app.push_screen("bookmarks")
 
     def action_add_bookmark(self) -> None:
         """Bookmark the currently selected job."""
-        job_table = self.query_one(JobTableWidget)
-        job = job_table.get_selected_job()
+        job = self._job_table.selected_job
 
         if job is None:
             self.notify("No job selected", severity="warning")
@@ -510,5 +593,4 @@ class MainScreen(Screen):
 
     def action_editor(self) -> None:
         """Open the built-in script editor screen."""
-        from .editor import EditorScreen
         self.app.push_screen(EditorScreen())
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 from typing import Optional
 
@@ -45,8 +45,10 @@ class BookmarkManager:
 
     def _load(self) -> None:
         """Load bookmarks from file."""
-        self.jobs: list[JobBookmark] = []
-        self.scripts: list[ScriptBookmark] = []
+        # Keyed by job_id / absolute path; dicts keep insertion order so the
+        # bookmark lists still come back in the order they were added.
+        self._jobs: dict[str, JobBookmark] = {}
+        self._scripts: dict[str, ScriptBookmark] = {}
 
         if not self.config_file.exists():
             return
@@ -56,56 +58,62 @@ class BookmarkManager:
                 data = json.load(f)
 
             for job_data in data.get("jobs", []):
-                self.jobs.append(JobBookmark(**job_data))
+                job = JobBookmark(**job_data)
+                self._jobs.setdefault(job.job_id, job)
 
             for script_data in data.get("scripts", []):
-                self.scripts.append(ScriptBookmark(**script_data))
+                script = ScriptBookmark(**script_data)
+                script.path = self._norm(script.path)
+                self._scripts.setdefault(script.path, script)
         except (json.JSONDecodeError, TypeError, KeyError):
             pass
 
     def _save(self) -> None:
         """Save bookmarks to file."""
         data = {
-            "jobs": [asdict(j) for j in self.jobs],
-            "scripts": [asdict(s) for s in self.scripts],
+            "jobs": [asdict(j) for j in self._jobs.values()],
+            "scripts": [asdict(s) for s in self._scripts.values()],
         }
 
-        with open(self.config_file, "w") as f:
+        # Write to a sibling temp file and rename over the original so a
+        # crash mid-write can never leave a truncated bookmarks.json.
+        tmp_file = self.config_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_file, self.config_file)
+
+    @staticmethod
+    def _norm(path: str) -> str:
+        """Canonical key for a script path; skips the getcwd() for absolute paths."""
+        return os.path.normpath(path) if os.path.isabs(path) else os.path.abspath(path)
 
     def add_job(self, job_id: str, name: str) -> bool:
         """Add a job bookmark. Returns True if added, False if already exists."""
-        # Check if already exists
-        for job in self.jobs:
-            if job.job_id == job_id:
-                return False
+        if job_id in self._jobs:
+            return False
 
         bookmark = JobBookmark(
             job_id=job_id,
             name=name,
-            added=datetime.now().strftime("%Y-%m-%d"),
+            added=date.today().isoformat(),
         )
-        self.jobs.append(bookmark)
+        self._jobs[job_id] = bookmark
         self._save()
         return True
 
     def remove_job(self, job_id: str) -> bool:
         """Remove a job bookmark. Returns True if removed."""
-        for i, job in enumerate(self.jobs):
-            if job.job_id == job_id:
-                del self.jobs[i]
-                self._save()
-                return True
-        return False
+        if self._jobs.pop(job_id, None) is None:
+            return False
+        self._save()
+        return True
 
     def add_script(self, path: str, name: Optional[str] = None) -> bool:
         """Add a script bookmark. Returns True if added, False if already exists."""
-        path = os.path.abspath(path)
+        path = self._norm(path)
 
-        # Check if already exists
-        for script in self.scripts:
-            if script.path == path:
-                return False
+        if path in self._scripts:
+            return False
 
         if name is None:
             name = os.path.basename(path)
@@ -113,35 +121,33 @@ class BookmarkManager:
         bookmark = ScriptBookmark(
             path=path,
             name=name,
-            added=datetime.now().strftime("%Y-%m-%d"),
+            added=date.today().isoformat(),
         )
-        self.scripts.append(bookmark)
+        self._scripts[path] = bookmark
         self._save()
         return True
 
     def remove_script(self, path: str) -> bool:
         """Remove a script bookmark. Returns True if removed."""
-        path = os.path.abspath(path)
-        for i, script in enumerate(self.scripts):
-            if script.path == path:
-                del self.scripts[i]
-                self._save()
-                return True
-        return False
+        path = self._norm(path)
+        if self._scripts.pop(path, None) is None:
+            return False
+        self._save()
+        return True
 
     def is_job_bookmarked(self, job_id: str) -> bool:
         """Check if a job is bookmarked."""
-        return any(j.job_id == job_id for j in self.jobs)
+        return job_id in self._jobs
 
     def is_script_bookmarked(self, path: str) -> bool:
         """Check if a script is bookmarked."""
-        path = os.path.abspath(path)
-        return any(s.path == path for s in self.scripts)
+        path = self._norm(path)
+        return path in self._scripts
 
-    def get_jobs(self) -> list[JobBookmark]:
-        """Get all job bookmarks."""
-        return self.jobs.copy()
+    def get_jobs(self) -> tuple[JobBookmark, ...]:
+        """Get all job bookmarks (a snapshot; don't mutate the entries)."""
+        return tuple(self._jobs.values())
 
-    def get_scripts(self) -> list[ScriptBookmark]:
-        """Get all script bookmarks."""
-        return self.scripts.copy()
+    def get_scripts(self) -> tuple[ScriptBookmark, ...]:
+        """Get all script bookmarks (a snapshot; don't mutate the entries)."""
+        return tuple(self._scripts.values())
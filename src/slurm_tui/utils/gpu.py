@@ -4,36 +4,57 @@ from __future__ import annotations
 
 import re
 import subprocess
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 
+# Partition topology changes on the scale of hours, not refresh ticks.
+_DISCOVERY_TTL = 3600.0
 
-@dataclass
+# Several widgets may ask for allocation within the same tick; answers this
+# fresh are served from memory instead of re-running squeue/sinfo.
+_ALLOCATION_TTL = 1.0
+
+# sreport is slow and yearly GPU hours move slowly; half the GPU hours
+# widget's 60s poll keeps a manual refresh from re-running it.
+_GPU_HOURS_TTL = 30.0
+
+# GPU counts in GRES strings, e.g. "gpu:4", "gpu:a100:4" or
+# "gpu:a100:2(S:0-1),gpu:v100:1".
+_GPU_GRES_RE = re.compile(r"gpu(?::[^:,\s]+)?:(\d+)")
+_TYPED_GPU_RE = re.compile(r"gpu:([^:]+):(\d+)")
+_UNTYPED_GPU_RE = re.compile(r"gpu:(\d+)")
+
+
+class GPUQueryError(RuntimeError):
+    """A Slurm command behind a GPU query failed (timeout, missing, non-zero exit)."""
+
+
+@dataclass(frozen=True)
 class PartitionGPU:
-    """GPU allocation for a partition."""
+    """GPU allocation for a partition.
+
+    Immutable; the percentages are computed once at construction because
+    every redraw of the GPU monitor reads them.
+    """
 
     partition: str
     allocated: int
     total: int
     non_preemptible: int = 0
+    usage_percent: float = field(init=False, repr=False, compare=False)
+    non_preemptible_percent: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        usage = (self.allocated / self.total) * 100 if self.total else 0.0
+        non_preempt = (self.non_preemptible / self.total) * 100 if self.total else 0.0
+        object.__setattr__(self, "usage_percent", usage)
+        object.__setattr__(self, "non_preemptible_percent", non_preempt)
 
     @property
     def preemptible(self) -> int:
         return self.allocated - self.non_preemptible
 
-    @property
-    def usage_percent(self) -> float:
-        """Calculate usage percentage."""
-        if self.total == 0:
-            return 0.0
-        return (self.allocated / self.total) * 100
-
-    @property
-    def non_preemptible_percent(self) -> float:
-        if self.total == 0:
-            return 0.0
-        return (self.non_preemptible / self.total) * 100
-
 
 @dataclass
 class GPUHoursEntry:
@@ -98,6 +119,10 @@ class GPUMonitor:
 
     def __init__(self, partition_gpus: dict[str, int] | None = None):
         self.partition_gpus = partition_gpus or self.DEFAULT_PARTITION_GPUS
+        self._discovered: tuple[float, dict[str, int]] | None = None
+        self._available: bool | None = None
+        self._allocation: tuple[float, list[PartitionGPU]] | None = None
+        self._gpu_hours: dict[tuple[str, str, int], tuple[float, list[GPUHoursEntry]]] = {}
 
     def _run_command(self, cmd: list[str], timeout: int = 30) -> tuple[str, str, int]:
         """Run a shell command and return stdout, stderr, returncode."""
@@ -115,49 +140,59 @@ class GPUMonitor:
             return "", f"Command not found: {cmd[0]}", 1
 
     def get_partition_allocation(self) -> list[PartitionGPU]:
-        """Get GPU allocation per partition using only 2 subprocess calls total."""
+        """Get GPU allocation per partition using only 2 subprocess calls total.
+
+        Raises GPUQueryError if squeue or sinfo fails.
+        """
+        if self._allocation is not None:
+            fetched_at, cached = self._allocation
+            if time.monotonic() - fetched_at < _ALLOCATION_TTL:
+                return list(cached)
+
         # Single squeue call for all running jobs' GRES + QOS
         allocated_by_part: dict[str, int] = {}
         non_preempt_by_part: dict[str, int] = {}
-        stdout, _, rc = self._run_command(
+        stdout, stderr, rc = self._run_command(
             ["squeue", "-h", "-t", "R", "-o", "%P|%b|%q"]
         )
-        if rc == 0:
-            for line in stdout.strip().split("\n"):
-                if not line or "|" not in line:
-                    continue
-                parts = line.split("|")
-                part_name = parts[0].strip().rstrip("*")
-                gres = parts[1].strip() if len(parts) > 1 else ""
-                qos = parts[2].strip() if len(parts) > 2 else ""
-                if gres and "gpu" in gres.lower():
-                    for match in re.finditer(r"gpu(?::[^:,\s]+)?:(\d+)", gres):
-                        gpu_count = int(match.group(1))
-                        allocated_by_part[part_name] = (
-                            allocated_by_part.get(part_name, 0) + gpu_count
+        if rc != 0:
+            raise GPUQueryError(f"squeue failed: {stderr.strip()}")
+        for line in stdout.strip().split("\n"):
+            if not line or "|" not in line:
+                continue
+            parts = line.split("|")
+            part_name = parts[0].strip().rstrip("*")
+            gres = parts[1].strip() if len(parts) > 1 else ""
+            qos = parts[2].strip() if len(parts) > 2 else ""
+            if gres:
+                for match in _GPU_GRES_RE.finditer(gres):
+                    gpu_count = int(match.group(1))
+                    allocated_by_part[part_name] = (
+                        allocated_by_part.get(part_name, 0) + gpu_count
+                    )
+                    if qos != "preemptible":
+                        non_preempt_by_part[part_name] = (
+                            non_preempt_by_part.get(part_name, 0) + gpu_count
                         )
-                        if qos != "preemptible":
-                            non_preempt_by_part[part_name] = (
-                                non_preempt_by_part.get(part_name, 0) + gpu_count
-                            )
 
         # Single sinfo call for all partitions' total GPUs
         total_by_part: dict[str, int] = {}
-        stdout, _, rc = self._run_command(
+        stdout, stderr, rc = self._run_command(
             ["sinfo", "-h", "-o", "%P|%G"]
         )
-        if rc == 0:
-            for line in stdout.strip().split("\n"):
-                if not line or "|" not in line:
-                    continue
-                parts = line.split("|", 1)
-                part_name = parts[0].strip().rstrip("*")
-                gres = parts[1].strip() if len(parts) > 1 else ""
-                if gres and "gpu" in gres.lower():
-                    for match in re.finditer(r"gpu(?::[^:,\s]+)?:(\d+)", gres):
-                        total_by_part[part_name] = (
-                            total_by_part.get(part_name, 0) + int(match.group(1))
-                        )
+        if rc != 0:
+            raise GPUQueryError(f"sinfo failed: {stderr.strip()}")
+        for line in stdout.strip().split("\n"):
+            if not line or "|" not in line:
+                continue
+            parts = line.split("|", 1)
+            part_name = parts[0].strip().rstrip("*")
+            gres = parts[1].strip() if len(parts) > 1 else ""
+            if gres:
+                for match in _GPU_GRES_RE.finditer(gres):
+                    total_by_part[part_name] = (
+                        total_by_part.get(part_name, 0) + int(match.group(1))
+                    )
 
         allocations = []
         for partition in self.partition_gpus:
@@ -171,7 +206,8 @@ class GPUMonitor:
                 non_preemptible=non_preemptible,
             ))
 
-        return allocations
+        self._allocation = (time.monotonic(), allocations)
+        return list(allocations)
 
     def get_gpu_hours(
         self,
@@ -182,6 +218,8 @@ class GPUMonitor:
         """Get GPU hours per user.
 
         Adapted from check_slurm_gpu_hours.sh
+
+        Raises GPUQueryError if sreport fails.
         """
         entries = []
 
@@ -191,6 +229,11 @@ class GPUMonitor:
         if end is None:
             end = f"{datetime.now().year}-12-31"
 
+        key = (start, end, limit)
+        cached = self._gpu_hours.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _GPU_HOURS_TTL:
+            return list(cached[1])
+
         cmd = [
             "sreport",
             "-n",
@@ -208,7 +251,7 @@ class GPUMonitor:
         stdout, stderr, rc = self._run_command(cmd, timeout=60)
 
         if rc != 0:
-            return entries
+            raise GPUQueryError(f"sreport failed: {stderr.strip()}")
 
         # Parse output: fields are pipe-separated
         # Format varies but typically: Cluster|Account|User|Used|...
@@ -244,10 +287,17 @@ class GPUMonitor:
 
         # Sort by hours descending and limit
         entries.sort(key=lambda x: x.hours, reverse=True)
-        return entries[:limit]
+        entries = entries[:limit]
+        self._gpu_hours[key] = (time.monotonic(), entries)
+        return list(entries)
 
     def discover_partitions(self) -> dict[str, int]:
-        """Discover partitions with GPUs from sinfo."""
+        """Discover partitions with GPUs from sinfo (cached for an hour)."""
+        if self._discovered is not None:
+            fetched_at, cached = self._discovered
+            if time.monotonic() - fetched_at < _DISCOVERY_TTL:
+                return dict(cached)
+
         partitions = {}
 
         cmd = ["sinfo", "-h", "-o", "%P|%G"]
@@ -267,14 +317,17 @@ class GPUMonitor:
             name = parts[0].rstrip("*")
             gres = parts[1]
 
-            if gres and "gpu" in gres.lower():
+            if gres:
                 total = 0
-                for match in re.finditer(r"gpu(?::[^:,\s]+)?:(\d+)", gres):
+                for match in _GPU_GRES_RE.finditer(gres):
                     total += int(match.group(1))
                 if total > 0:
                     partitions[name] = total
 
-        return partitions if partitions else self.partition_gpus
+        if not partitions:
+            return self.partition_gpus
+        self._discovered = (time.monotonic(), partitions)
+        return dict(partitions)
 
     def get_partition_details(self, partition: str) -> list[NodeGPU]:
         """Get per-node GPU details for a partition."""
@@ -299,12 +352,12 @@ class GPUMonitor:
             # Parse GPU type and count from GRES (e.g. "gpu:rtx3090:2")
             gpu_type = "gpu"
             gpu_count = 0
-            gres_match = re.search(r"gpu:([^:]+):(\d+)", gres)
+            gres_match = _TYPED_GPU_RE.search(gres)
             if gres_match:
                 gpu_type = gres_match.group(1)
                 gpu_count = int(gres_match.group(2))
             else:
-                count_match = re.search(r"gpu:(\d+)", gres)
+                count_match = _UNTYPED_GPU_RE.search(gres)
                 if count_match:
                     gpu_count = int(count_match.group(1))
 
@@ -418,6 +471,19 @@ class GPUMonitor:
             return 0.0
 
     def is_available(self) -> bool:
-        """Check if GPU monitoring commands are available."""
-        _, _, rc = self._run_command(["squeue", "--version"])
-        return rc == 0
+        """Check if GPU monitoring commands are available (probed once per instance)."""
+        if self._available is None:
+            _, _, rc = self._run_command(["squeue", "--version"])
+            self._available = rc == 0
+        return self._available
+
+
+_shared_monitor: GPUMonitor | None = None
+
+
+def get_gpu_monitor() -> GPUMonitor:
+    """Return the process-wide GPUMonitor, creating it on first use."""
+    global _shared_monitor
+    if _shared_monitor is None:
+        _shared_monitor = GPUMonitor()
+    return _shared_monitor
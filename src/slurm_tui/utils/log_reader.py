@@ -3,55 +3,88 @@
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from textual.widgets import TextArea
+
+
+# Everything on a line up to its last \r that is followed by more text, i.e.
+# what the terminal would have overwritten.  A \r directly before \n or EOF
+# (CRLF endings, tqdm's final refresh) overwrites nothing.  Anchoring at the
+# line start keeps the match linear: one greedy scan and backtrack per line.
+_CR_OVERWRITTEN = re.compile(r"^[^\n]*\r(?=[^\r\n])", re.MULTILINE)
+
+# ANSI CSI sequences (colours, cursor moves) that progress bars and coloured
+# loggers emit; the TextArea would show them as literal junk.
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]")
 
 
 def _process_cr(content: str) -> list[str]:
     """Simulate terminal \\r behaviour: keep only the last \\r-segment per line.
 
     tqdm writes progress bars using \\r without \\n, so a training log can
-    contain megabytes of data on a single "line".  We split on both \\n and
-    \\r to handle this correctly.
+    contain megabytes of data on a single "line".  The overwritten segments
+    are removed in one regex pass before splitting on \\n.  ANSI escape
+    sequences are stripped first.
     """
-    result_lines: list[str] = []
-    for raw_line in content.split("\n"):
-        if "\r" in raw_line:
-            final = raw_line.rsplit("\r", 1)[-1]
-            if final.strip():
-                result_lines.append(final)
-        elif raw_line.strip():
-            result_lines.append(raw_line)
-    return result_lines
+    if "\x1b" in content:
+        content = _ANSI_ESCAPE.sub("", content)
+    if "\r" in content:
+        content = _CR_OVERWRITTEN.sub("", content)
+    return [line.rstrip("\r") for line in content.split("\n") if line.strip()]
 
 
-def read_log_file(path: str, tail: int = 1000) -> str:
-    """Read log file tail efficiently with terminal simulation for carriage returns."""
-    try:
-        file_size = os.path.getsize(path)
+# Initial loads only look at this much of the end of a log
+_TAIL_BYTES = 2 * 1024 * 1024  # 2MB
 
-        # For large files, only read the tail portion
-        tail_bytes = 2 * 1024 * 1024  # 2MB
-        truncated = False
+# Follow mode keeps at most this many lines in a log view
+MAX_LOG_LINES = 2000
 
-        with open(path, "rb") as f:
-            if file_size > tail_bytes:
-                f.seek(-tail_bytes, 2)
-                truncated = True
-            raw = f.read()
 
-        content = raw.decode("utf-8", errors="replace")
-        result_lines = _process_cr(content)
-
-        # Limit to last N lines
-        if len(result_lines) > tail:
-            result_lines = (
-                [f"... ({len(result_lines) - tail} lines omitted) ..."]
-                + result_lines[-tail:]
-            )
-        elif truncated:
-            result_lines = ["... (showing tail of large file) ..."] + result_lines
-
-        return "\n".join(result_lines)
+def _read_tail(path: str, file_size: int, tail: int) -> tuple[str, int]:
+    """Read the last lines of *path* from a bounded window at EOF.
+
+    Returns the processed text and the offset reached, so callers can
+    continue from there incrementally.
+    """
+    truncated = file_size > _TAIL_BYTES
+
+    with open(path, "rb") as f:
+        if truncated:
+            f.seek(-_TAIL_BYTES, 2)
+        raw = f.read()
+        offset = f.tell()
+
+    if truncated:
+        # The window almost always starts mid-line; drop that fragment.
+        # Without a newline (a long run of \r-only progress updates) keep
+        # it all: _process_cr keeps just the last \r segment anyway.
+        newline = raw.find(b"\n")
+        if newline != -1:
+            raw = raw[newline + 1:]
+
+    result_lines = _process_cr(raw.decode("utf-8", errors="replace"))
+
+    # Limit to last N lines
+    if len(result_lines) > tail:
+        result_lines = (
+            [f"... ({len(result_lines) - tail} lines omitted) ..."]
+            + result_lines[-tail:]
+        )
+    elif truncated:
+        result_lines = ["... (showing tail of large file) ..."] + result_lines
+
+    return "\n".join(result_lines), offset
+
+
+def read_log_file(path: str, tail: int = 1000) -> str:
+    """Read log file tail efficiently with terminal simulation for carriage returns."""
+    try:
+        content, _ = _read_tail(path, os.path.getsize(path), tail)
+        return content
     except Exception as e:
         return f"Error reading log: {e}"
 
@@ -62,11 +95,13 @@ class LogTail:
 
     path: str
     offset: int = 0
+    inode: int = 0
     _initialized: bool = field(default=False, repr=False)
 
     def reset(self) -> None:
-        """Reset to uninitialized state (e.g. after file truncation)."""
+        """Reset to uninitialized state (e.g. after truncation or rotation)."""
         self.offset = 0
+        self.inode = 0
         self._initialized = False
 
 
@@ -83,42 +118,23 @@ def read_log_incremental(tail: LogTail, initial_tail: int = 1000) -> str | None:
     Returns None on error or missing file.
     """
     try:
-        if not os.path.exists(tail.path):
+        # One stat covers existence, size and identity
+        try:
+            st = os.stat(tail.path)
+        except FileNotFoundError:
             return None
+        file_size = st.st_size
 
-        file_size = os.path.getsize(tail.path)
-
-        # Truncation detection: file shrank since last read
-        if tail._initialized and file_size < tail.offset:
+        # Truncation/rotation detection: file shrank or was replaced
+        if tail._initialized and (file_size < tail.offset or st.st_ino != tail.inode):
             tail.reset()
 
         if not tail._initialized:
             # --- initial load (same logic as read_log_file) ---
-            tail_bytes = 2 * 1024 * 1024  # 2MB
-            truncated = False
-
-            with open(tail.path, "rb") as f:
-                if file_size > tail_bytes:
-                    f.seek(-tail_bytes, 2)
-                    truncated = True
-                raw = f.read()
-                tail.offset = f.tell()
-
-            content = raw.decode("utf-8", errors="replace")
-            result_lines = _process_cr(content)
-
-            if len(result_lines) > initial_tail:
-                result_lines = (
-                    [f"... ({len(result_lines) - initial_tail} lines omitted) ..."]
-                    + result_lines[-initial_tail:]
-                )
-            elif truncated:
-                result_lines = [
-                    "... (showing tail of large file) ..."
-                ] + result_lines
-
+            content, tail.offset = _read_tail(tail.path, file_size, initial_tail)
+            tail.inode = st.st_ino
             tail._initialized = True
-            return "\n".join(result_lines)
+            return content
 
         # --- incremental read ---
         if file_size <= tail.offset:
@@ -126,7 +142,8 @@ def read_log_incremental(tail: LogTail, initial_tail: int = 1000) -> str | None:
 
         with open(tail.path, "rb") as f:
             f.seek(tail.offset)
-            raw = f.read()
+            # Only the bytes stat saw; anything written since is next tick's
+            raw = f.read(file_size - tail.offset)
             tail.offset = f.tell()
 
         content = raw.decode("utf-8", errors="replace")
@@ -140,3 +157,17 @@ def read_log_incremental(tail: LogTail, initial_tail: int = 1000) -> str | None:
 
     except Exception:
         return None
+
+
+def append_log_text(area: TextArea, text: str, max_lines: int = MAX_LOG_LINES) -> None:
+    """Append follow-mode text to a log view, dropping the oldest lines past *max_lines*.
+
+    Auto-scrolls only if the user was already at the bottom.
+    """
+    was_at_bottom = area.scroll_y >= area.max_scroll_y
+    area.insert(text, area.document.end)
+    excess = area.document.line_count - max_lines
+    if excess > 0:
+        area.delete((0, 0), (excess, 0))
+    if was_at_bottom:
+        area.scroll_end(animate=False)
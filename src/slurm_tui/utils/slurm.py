@@ -2,11 +2,41 @@
 
 from __future__ import annotations
 
+import getpass
 import os
 import re
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional
+
+# How long scontrol job details stay fresh. Selecting a job and then opening
+# its log viewer should reuse one scontrol call rather than issuing two.
+_JOB_DETAILS_TTL = 5.0
+
+# squeue results this fresh are reused, so near-coincident refreshes (a
+# timer tick plus a manual refresh) share one subprocess call.
+_JOBS_TTL = 1.0
+
+
+def _current_username() -> str:
+    """Resolve the login name once: $USER, $USERNAME, then getpass (passwd entry)."""
+    name = os.environ.get("USER") or os.environ.get("USERNAME")
+    if name:
+        return name
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        return "unknown"
+
+
+# Login name of the user running the TUI, resolved once at import
+USERNAME = _current_username()
+
+_ARRAY_JOB_RE = re.compile(r"^(\d+)_\[.*\]$")
+_GPU_GRES_RE = re.compile(r"gpu(?::[^:]+)?:(\d+)")
+_SUBMIT_RE = re.compile(r"Submitted batch job (\d+)")
 
 
 @dataclass
@@ -46,17 +76,29 @@ def normalize_array_job_id(job_id: str) -> str:
     to the base job ID '128417', which scontrol can query.
     Individual array task IDs like '128417_2' are left unchanged.
     """
-    m = re.match(r"^(\d+)_\[.*\]$", job_id)
+    m = _ARRAY_JOB_RE.match(job_id)
     if m:
         return m.group(1)
     return job_id
 
 
+def _to_int(value: str) -> int:
+    """Parse an integer field from Slurm output, falling back to 0."""
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
 class SlurmClient:
     """Client for interacting with SLURM."""
 
     def __init__(self):
-        self.username = os.environ.get("USER", os.environ.get("USERNAME", "unknown"))
+        self.username = USERNAME
+        self._partitions: list[str] | None = None
+        self._job_details: dict[str, tuple[float, dict]] = {}
+        self._available: bool | None = None
+        self._jobs: dict[tuple[str, bool], tuple[float, list[Job]]] = {}
 
     def _run_command(self, cmd: list[str], timeout: int = 30) -> tuple[str, str, int]:
         """Run a shell command and return stdout, stderr, returncode."""
@@ -73,34 +115,72 @@ class SlurmClient:
         except FileNotFoundError:
             return "", f"Command not found: {cmd[0]}", 1
 
+    def _stream_lines(self, cmd: list[str], timeout: int = 30) -> Iterator[str]:
+        """Yield stdout lines as the command produces them.
+
+        Raises OSError if the command can't be started and
+        subprocess.CalledProcessError if it exits non-zero (including being
+        killed after `timeout` seconds).
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=65536,
+        )
+        killer = threading.Timer(timeout, proc.kill)
+        killer.start()
+        try:
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+        finally:
+            killer.cancel()
+            proc.stdout.close()
+            rc = proc.wait()
+        if rc != 0:
+            raise subprocess.CalledProcessError(rc, cmd)
+
     def get_jobs(self, user: Optional[str] = None, all_users: bool = False) -> list[Job]:
         """Get list of jobs from squeue."""
-        jobs = []
-
         # Format: JobID|Name|User|State|Partition|QOS|GRES|NumCPUs|MinMemory|TimeUsed|NodeList|Reason
         fmt = "%i|%j|%u|%t|%P|%q|%b|%C|%m|%M|%N|%r"
 
+        key = ("" if all_users else user or self.username, all_users)
+        cached = self._jobs.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _JOBS_TTL:
+            return list(cached[1])
+
         cmd = ["squeue", "-h", "-o", fmt]
         if not all_users:
-            cmd.extend(["-u", user or self.username])
+            cmd.extend(["-u", key[0]])
 
-        stdout, stderr, rc = self._run_command(cmd)
-        if rc != 0:
-            return jobs
-
-        for line in stdout.strip().split("\n"):
+        # Parse lines as squeue writes them instead of buffering the whole
+        # listing first — on large clusters the output runs to megabytes.
+        try:
+            jobs = list(self._parse_jobs(self._stream_lines(cmd)))
+        except (OSError, subprocess.SubprocessError):
+            return []
+        self._jobs[key] = (time.monotonic(), jobs)
+        return list(jobs)
+
+    @staticmethod
+    def _parse_jobs(lines: Iterator[str]) -> Iterator[Job]:
+        """Parse squeue lines produced by the get_jobs format string."""
+        gpu_search = _GPU_GRES_RE.search
+        for line in lines:
             if not line:
                 continue
 
             parts = line.split("|")
             if len(parts) < 11:
                 continue
+            job_id, name, user, state, partition, qos, gres, cpus, memory, runtime, node = parts[:11]
 
             # Parse GPU count from GRES (e.g., "gpu:4" or "gpu:a100:4")
             gpus = 0
-            gres = parts[6]
-            if gres and "gpu" in gres.lower():
-                match = re.search(r"gpu(?::[^:]+)?:(\d+)", gres)
+            if gres:
+                match = gpu_search(gres)
                 if match:
                     gpus = int(match.group(1))
 
@@ -110,25 +190,21 @@ class SlurmClient:
             if reason.lower() in ("none", ""):
                 reason = ""
 
-            jobs.append(
-                Job(
-                    job_id=parts[0],
-                    name=parts[1],
-                    user=parts[2],
-                    state=parts[3],
-                    partition=parts[4],
-                    qos=parts[5],
-                    gpus=gpus,
-                    cpus=int(parts[7]) if parts[7].isdigit() else 0,
-                    memory=parts[8],
-                    runtime=parts[9],
-                    node=parts[10] if parts[10] else "-",
-                    reason=reason,
-                )
+            yield Job(
+                job_id=job_id,
+                name=name,
+                user=user,
+                state=state,
+                partition=partition,
+                qos=qos,
+                gpus=gpus,
+                cpus=_to_int(cpus),
+                memory=memory,
+                runtime=runtime,
+                node=node or "-",
+                reason=reason,
             )
 
-        return jobs
-
     def get_partitions(self) -> list[Partition]:
         """Get list of partitions from sinfo."""
         partitions = []
@@ -184,7 +260,7 @@ class SlurmClient:
         stdout, stderr, rc = self._run_command(["sbatch", script_path])
         if rc == 0:
             # Extract job ID from "Submitted batch job 12345"
-            match = re.search(r"Submitted batch job (\d+)", stdout)
+            match = _SUBMIT_RE.search(stdout)
             if match:
                 return True, f"Submitted job {match.group(1)}"
             return True, stdout.strip()
@@ -198,6 +274,10 @@ class SlurmClient:
         returns the first element's details.
         """
         normalized = normalize_array_job_id(job_id)
+        cached = self._job_details.get(normalized)
+        if cached is not None and time.monotonic() - cached[0] < _JOB_DETAILS_TTL:
+            return dict(cached[1])
+
         cmd = ["scontrol", "show", "job", normalized]
         stdout, stderr, rc = self._run_command(cmd)
         if rc != 0:
@@ -212,7 +292,13 @@ class SlurmClient:
                 if key not in details:
                     details[key] = value
 
-        return details
+        self._job_details[normalized] = (time.monotonic(), details)
+        return dict(details)
+
+    def invalidate_job_cache(self) -> None:
+        """Forget cached job state so the next lookups re-query Slurm."""
+        self._job_details.clear()
+        self._jobs.clear()
 
     def get_batch_script(self, job_id: str) -> Optional[str]:
         """Retrieve the batch script content directly from Slurm's controller.
@@ -292,14 +378,36 @@ class SlurmClient:
         return False, stderr.strip() or "Failed to update partition"
 
     def get_available_partitions(self) -> list[str]:
-        """Get list of available partition names."""
-        cmd = ["sinfo", "-h", "-o", "%P"]
-        stdout, stderr, rc = self._run_command(cmd)
-        if rc != 0:
-            return []
-        return [p.strip().rstrip("*") for p in stdout.strip().split("\n") if p.strip()]
+        """Get list of available partition names.
+
+        Partitions rarely change during a session, so the first successful
+        sinfo result is cached for the lifetime of the client.
+        """
+        if self._partitions is None:
+            cmd = ["sinfo", "-h", "-o", "%P"]
+            stdout, stderr, rc = self._run_command(cmd)
+            if rc != 0:
+                return []
+            partitions = [p.strip().rstrip("*") for p in stdout.strip().split("\n") if p.strip()]
+            if not partitions:
+                return []
+            self._partitions = partitions
+        return list(self._partitions)
 
     def is_available(self) -> bool:
-        """Check if SLURM commands are available."""
-        _, _, rc = self._run_command(["squeue", "--version"])
-        return rc == 0
+        """Check if SLURM commands are available (probed once per instance)."""
+        if self._available is None:
+            _, _, rc = self._run_command(["squeue", "--version"])
+            self._available = rc == 0
+        return self._available
+
+
+_shared_client: SlurmClient | None = None
+
+
+def get_slurm_client() -> SlurmClient:
+    """Return the process-wide SlurmClient, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = SlurmClient()
+    return _shared_client
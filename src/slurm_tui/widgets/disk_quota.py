@@ -88,11 +88,13 @@ class DiskQuotaWidget(Widget):
         self,
         quota_monitor: QuotaMonitor | None = None,
         refresh_interval: float = 60.0,
+        auto_poll: bool = True,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.quota_monitor = quota_monitor or QuotaMonitor()
         self.refresh_interval = refresh_interval
+        self.auto_poll = auto_poll
         self._timer = None
         self._collapsed = False
         self._quotas: list[DiskQuota] = []
@@ -110,6 +112,8 @@ class DiskQuotaWidget(Widget):
 
     def on_mount(self) -> None:
         """Start auto-refresh timer (6s offset to stagger with other widgets)."""
+        if not self.auto_poll:
+            return  # The parent screen schedules refresh_data()
         self.set_timer(6.0, self._start_refresh)
 
     def _start_refresh(self) -> None:
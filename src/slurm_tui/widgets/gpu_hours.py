@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import os
 from datetime import datetime
+from functools import lru_cache
 
 from textual import work
 from textual.app import ComposeResult
@@ -11,8 +11,14 @@ from textual.widgets import Static
 from textual.widget import Widget
 from textual.worker import get_current_worker
 
-from ..utils.gpu import GPUMonitor, GPUHoursEntry
-from ..utils.slurm import Job
+from ..utils.gpu import GPUMonitor, GPUHoursEntry, get_gpu_monitor
+from ..utils.slurm import USERNAME, Job
+from .polling import SlurmPollBackoff
+
+# Rank colors for the top three users; everyone else is dimmed.
+_RANK_COLORS = ("#e0af68", "#c0caf5", "#bb9af7")
+
+_SEPARATOR = "[#414868]" + "─" * 56 + "[/]"
 
 
 def make_hours_bar(hours: float, max_hours: float, width: int = 20) -> str:
@@ -20,12 +26,37 @@ def make_hours_bar(hours: float, max_hours: float, width: int = 20) -> str:
     if max_hours <= 0:
         return "░" * width
     percent = min(hours / max_hours, 1.0)
-    filled = int(percent * width)
-    empty = width - filled
-    return "█" * filled + "░" * empty
+    return _hours_bar(int(percent * width), width)
+
+
+@lru_cache(maxsize=64)
+def _hours_bar(filled: int, width: int) -> str:
+    """Bar string for a given fill; there are only width + 1 of them."""
+    return f"{'█' * filled}{'░' * (width - filled)}"
+
 
+def _render_hours_row(
+    rank: int, user: str, hours: float, max_hours: float, is_current: bool
+) -> str:
+    """Render one ranked user line of the expanded GPU hours list."""
+    rank_color = _RANK_COLORS[rank - 1] if rank <= len(_RANK_COLORS) else "#565f89"
 
-class GPUHoursWidget(Widget):
+    user_color = "#9ece6a" if is_current else "#c0caf5"
+    hours_color = "#9ece6a" if is_current else "#565f89"
+    bar_color = "#9ece6a" if is_current else "#7aa2f7"
+    marker = " ←" if is_current else ""
+
+    bar = make_hours_bar(hours, max_hours)
+    return (
+        f"[{rank_color}]{rank:2}.[/]"
+        f"[{user_color}]{user[:10]:<10}[/]  "
+        f"[{hours_color}]{hours:>8,.0f}[/]  "
+        f"[{bar_color}]{bar}[/]"
+        f"[#9ece6a]{marker}[/]"
+    )
+
+
+class GPUHoursWidget(SlurmPollBackoff, Widget):
     """Widget showing GPU hours per user."""
 
     DEFAULT_CSS = """
@@ -52,17 +83,27 @@ class GPUHoursWidget(Widget):
         self,
         gpu_monitor: GPUMonitor | None = None,
         refresh_interval: float = 60.0,
+        auto_poll: bool = True,
         **kwargs,
     ):
         super().__init__(**kwargs)
-        self.gpu_monitor = gpu_monitor or GPUMonitor()
+        self.gpu_monitor = gpu_monitor or get_gpu_monitor()
         self.refresh_interval = refresh_interval
-        self.current_user = os.environ.get("USER", "")
+        self.auto_poll = auto_poll
+        self.current_user = USERNAME
         self._timer = None
         self._entries: list[GPUHoursEntry] = []
+        # Expanded-list lines, rendered once per report rather than per redraw
+        self._hours_rows: list[str] = []
         self._running_jobs: list[Job] = []
+        # Derived once per data update and reused by every redraw
+        self._running_gpus = 0
+        self._running_cpus = 0
+        self._user_rank_text = ""
         self._expanded: bool = False
         self._hours_collapsed: bool = True
+        # Report year, re-read whenever new hours arrive (sreport's default range)
+        self._year = datetime.now().year
 
     def compose(self) -> ComposeResult:
         yield Static(self._render_hours_collapsed(), classes="hours-all")
@@ -70,6 +111,8 @@ class GPUHoursWidget(Widget):
 
     def on_mount(self) -> None:
         """Start timer and load initial data (5s offset — sreport is slow, load last)."""
+        if not self.auto_poll:
+            return  # The parent screen schedules refresh_data()
         self.set_timer(5.0, self._start_refresh)
 
     def _start_refresh(self) -> None:
@@ -79,19 +122,48 @@ class GPUHoursWidget(Widget):
     @work(thread=True, exclusive=True)
     def refresh_data(self) -> None:
         """Refresh GPU hours in background thread."""
+        if not self.poll_allowed():
+            return
         worker = get_current_worker()
         try:
             entries = self.gpu_monitor.get_gpu_hours(limit=10)
-            if not worker.is_cancelled:
-                self.app.call_from_thread(self._apply_hours, entries)
-        except Exception:
-            pass
+        except Exception as exc:
+            # Failed command or parse error: retry later, but say why
+            self.poll_failed(exc)
+            return
+        # An empty report (no GPU usage yet) is a valid answer, not a failure
+        self.poll_succeeded()
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._apply_hours, entries)
 
     def _apply_hours(self, entries: list[GPUHoursEntry]) -> None:
         """Update GPU hours display imperatively."""
+        year = datetime.now().year
+        if entries == self._entries and year == self._year:
+            return  # Unchanged report; skip the redraw
         self._entries = entries
+        self._year = year
+        self._hours_rows = self._build_hours_rows(entries)
+        self._user_rank_text = next(
+            (
+                f"#{i} {e.hours:,.0f}h"
+                for i, e in enumerate(entries, 1)
+                if e.user == self.current_user
+            ),
+            "",
+        )
         self._render_hours()
 
+    def _build_hours_rows(self, entries: list[GPUHoursEntry]) -> list[str]:
+        """Render the ranked lines of the expanded list for a new report."""
+        if not entries:
+            return []
+        max_hours = max(e.hours for e in entries)
+        return [
+            _render_hours_row(i, e.user, e.hours, max_hours, e.user == self.current_user)
+            for i, e in enumerate(entries, 1)
+        ]
+
     def _get_width(self) -> int:
         """Get available content width."""
         try:
@@ -106,7 +178,7 @@ class GPUHoursWidget(Widget):
           ── GPU Hours 2026  Top 10   ·  #3 10,129h  ·  h to expand
           ── Running Jobs    19 jobs  ·  22 GPUs      ·  o to expand
         """
-        year = datetime.now().year
+        year = self._year
         w = self._get_width()
 
         # Column 1: label (padded to same width)
@@ -121,21 +193,14 @@ class GPUHoursWidget(Widget):
         col2_w = max(len(h_col2), len(r_col2))
 
         # Column 3: second info
-        user_plain = ""
-        user_rich = ""
-        for i, entry in enumerate(self._entries, 1):
-            if entry.user == self.current_user:
-                user_plain = f"#{i} {entry.hours:,.0f}h"
-                user_rich = f"[#9ece6a]{user_plain}[/]"
-                break
-        total_gpus = sum(j.gpus for j in self._running_jobs)
-        r_col3 = f"{total_gpus} GPUs"
+        user_plain = self._user_rank_text
+        user_rich = f"[#9ece6a]{user_plain}[/]" if user_plain else ""
+        r_col3 = f"{self._running_gpus} GPUs"
         h_col3 = user_plain
         col3_w = max(len(h_col3), len(r_col3)) if (h_col3 or r_col3) else 0
 
         # Column 4: third info (only running)
-        total_cpus = sum(j.cpus for j in self._running_jobs)
-        r_col4 = f"{total_cpus} CPUs"
+        r_col4 = f"{self._running_cpus} CPUs"
 
         # Hints right-aligned
         h_hint = "h to expand"
@@ -184,41 +249,16 @@ class GPUHoursWidget(Widget):
             content.update(self._render_hours_collapsed())
             return
 
-        year = datetime.now().year
+        year = self._year
         lines = [
             f"[#565f89]GPU Hours {year}[/]                          [#414868]Top 10[/]",
-            "[#414868]" + "─" * 56 + "[/]",
+            _SEPARATOR,
         ]
 
-        if not self._entries:
+        if not self._hours_rows:
             lines.append("[#565f89]No data available[/]")
         else:
-            max_hours = max(e.hours for e in self._entries)
-            for i, entry in enumerate(self._entries, 1):
-                is_current = entry.user == self.current_user
-
-                if i == 1:
-                    rank_color = "#e0af68"
-                elif i == 2:
-                    rank_color = "#c0caf5"
-                elif i == 3:
-                    rank_color = "#bb9af7"
-                else:
-                    rank_color = "#565f89"
-
-                user_color = "#9ece6a" if is_current else "#c0caf5"
-                hours_color = "#9ece6a" if is_current else "#565f89"
-                bar_color = "#9ece6a" if is_current else "#7aa2f7"
-                marker = " ←" if is_current else ""
-
-                bar = make_hours_bar(entry.hours, max_hours)
-                lines.append(
-                    f"[{rank_color}]{i:2}.[/]"
-                    f"[{user_color}]{entry.user[:10]:<10}[/]  "
-                    f"[{hours_color}]{entry.hours:>8,.0f}[/]  "
-                    f"[{bar_color}]{bar}[/]"
-                    f"[#9ece6a]{marker}[/]"
-                )
+            lines.extend(self._hours_rows)
 
         content.update("\n".join(lines))
 
@@ -227,16 +267,13 @@ class GPUHoursWidget(Widget):
         if not self._running_jobs:
             return ""
 
-        total_gpus = sum(j.gpus for j in self._running_jobs)
-        total_cpus = sum(j.cpus for j in self._running_jobs)
-
         if not self._expanded:
             _, running_line = self._render_collapsed_lines()
             return running_line
 
         lines = [
-            f"Running ({len(self._running_jobs)} jobs, {total_gpus} GPUs)",
-            "[#414868]" + "─" * 56 + "[/]",
+            f"Running ({len(self._running_jobs)} jobs, {self._running_gpus} GPUs)",
+            _SEPARATOR,
         ]
         for job in self._running_jobs[:8]:
             gpu_str = f"{job.gpus}×GPU" if job.gpus > 0 else "  —  "
@@ -256,17 +293,21 @@ class GPUHoursWidget(Widget):
         """Update the running section Static widget."""
         try:
             section = self.query_one(".running-section", Static)
-            section.update(self._render_running())
-            # Re-render hours collapsed line too so columns stay aligned
-            if self._hours_collapsed:
-                content = self.query_one(".hours-all", Static)
-                content.update(self._render_hours_collapsed())
+            # Both lines change together; paint them in one frame
+            with self.app.batch_update():
+                section.update(self._render_running())
+                # Re-render hours collapsed line too so columns stay aligned
+                if self._hours_collapsed:
+                    content = self.query_one(".hours-all", Static)
+                    content.update(self._render_hours_collapsed())
         except Exception:
             pass
 
     def update_running_jobs(self, jobs: list[Job]) -> None:
         """Update running jobs from external source (e.g. JobTableWidget)."""
         self._running_jobs = [j for j in jobs if j.state == "R"]
+        self._running_gpus = sum(j.gpus for j in self._running_jobs)
+        self._running_cpus = sum(j.cpus for j in self._running_jobs)
         self._update_running_section()
 
     def toggle_hours(self) -> None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal
@@ -9,13 +11,14 @@ from textual.widgets import Static
 from textual.widget import Widget
 from textual.worker import get_current_worker
 
-from ..utils.gpu import GPUMonitor, PartitionGPU
-
+from ..utils.gpu import GPUMonitor, PartitionGPU, get_gpu_monitor
+from .polling import SlurmPollBackoff
 
 # Unicode block characters for gradient-style progress bar
 BLOCKS = " ▁▂▃▄▅▆▇█"
 
 
+@lru_cache(maxsize=512)
 def make_gradient_bar(percent: float, non_preempt_percent: float = 0.0, width: int = 25) -> str:
     """Create a two-tone progress bar: red for non-preemptible, yellow for preemptible."""
     non_preempt_chars = int(non_preempt_percent / 100 * width + 0.5)
@@ -23,12 +26,11 @@ def make_gradient_bar(percent: float, non_preempt_percent: float = 0.0, width: i
     preempt_chars = total_filled - non_preempt_chars
     empty = width - total_filled
 
-    bar = (
-        f"[#f7768e]" + "█" * non_preempt_chars + "[/]"
-        + f"[#e0af68]" + "▒" * preempt_chars + "[/]"
-        + "░" * empty
+    return (
+        f"[#f7768e]{'█' * non_preempt_chars}[/]"
+        f"[#e0af68]{'▒' * preempt_chars}[/]"
+        f"{'░' * empty}"
     )
-    return bar
 
 
 def _render_partition_row(partition: PartitionGPU) -> str:
@@ -47,7 +49,7 @@ def _render_partition_row(partition: PartitionGPU) -> str:
     )
 
 
-class GPUMonitorWidget(Widget):
+class GPUMonitorWidget(SlurmPollBackoff, Widget):
     """Widget showing GPU allocation per partition with auto-refresh."""
 
     DEFAULT_CSS = """
@@ -95,11 +97,13 @@ class GPUMonitorWidget(Widget):
         self,
         gpu_monitor: GPUMonitor | None = None,
         refresh_interval: float = 10.0,
+        auto_poll: bool = True,
         **kwargs,
     ):
         super().__init__(**kwargs)
-        self.gpu_monitor = gpu_monitor or GPUMonitor()
+        self.gpu_monitor = gpu_monitor or get_gpu_monitor()
         self.refresh_interval = refresh_interval
+        self.auto_poll = auto_poll
         self._timer = None
         self._detail_index: int = -1
         self.partitions: list[PartitionGPU] = []
@@ -114,6 +118,8 @@ class GPUMonitorWidget(Widget):
 
     def on_mount(self) -> None:
         """Start auto-refresh timer on mount (1s offset to let job table load first)."""
+        if not self.auto_poll:
+            return  # The parent screen schedules refresh_data()
         self.set_timer(1.0, self._start_refresh)
 
     def _start_refresh(self) -> None:
@@ -123,16 +129,23 @@ class GPUMonitorWidget(Widget):
     @work(thread=True, exclusive=True)
     def refresh_data(self) -> None:
         """Refresh GPU allocation data in background thread."""
+        if not self.poll_allowed():
+            return
         worker = get_current_worker()
         try:
             partitions = self.gpu_monitor.get_partition_allocation()
-            if not worker.is_cancelled:
-                self.app.call_from_thread(self._apply_data, partitions)
-        except Exception:
-            pass
+        except Exception as exc:
+            # Failed command or parse error: retry later, but say why
+            self.poll_failed(exc)
+            return
+        self.poll_succeeded()
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._apply_data, partitions)
 
     def _apply_data(self, partitions: list[PartitionGPU]) -> None:
         """Update partition display imperatively — no recompose."""
+        if partitions == self.partitions:
+            return  # Same allocation as last tick; nothing to redraw
         self.partitions = partitions
         content = self.query_one(".partition-content", Static)
         if not partitions:
@@ -29,10 +29,10 @@ from textual.widgets import Static, TextArea
 from textual.widget import Widget
 from textual.worker import get_current_worker
 
-from ..utils.slurm import SlurmClient, Job
+from ..utils.slurm import SlurmClient, Job, get_slurm_client
 from ..utils.gpu import GPUMonitor, PartitionGPU, NodeGPU, GPUStats
 from ..utils.bookmarks import BookmarkManager
-from ..utils.log_reader import LogTail, read_log_incremental
+from ..utils.log_reader import LogTail, append_log_text, read_log_incremental
 
 
 def _color_for(percent: float) -> str:
@@ -173,7 +173,7 @@ class JobDetailsWidget(Widget):
         **kwargs,
     ):
         super().__init__(**kwargs)
-        self.slurm_client = slurm_client or SlurmClient()
+        self.slurm_client = slurm_client or get_slurm_client()
         self.bookmark_manager = bookmark_manager or BookmarkManager()
 
         # Current view state
@@ -313,10 +313,13 @@ class JobDetailsWidget(Widget):
 
         # Read script content — try file first, fall back to scontrol
         script_content = "Script not available"
-        if script_path and os.path.exists(script_path):
+        # (EAFP: open() alone is one round-trip on NFS, exists() + open() two)
+        if script_path:
             try:
                 with open(script_path) as f:
                     script_content = f.read()
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 script_content = f"Error reading script: {e}"
 
@@ -393,10 +396,6 @@ class JobDetailsWidget(Widget):
 
             script_header = Static("Script [read-only] [Ctrl+E to edit]", classes="script-header")
             script_path_label = Static(f"{script_path or 'N/A'}", classes="script-path")
-            container.mount(script_header)
-            container.mount(script_path_label)
-            container.mount(Static("─" * 40, classes="separator"))
-
             script_area = TextArea(
                 script_content,
                 language="bash",
@@ -404,19 +403,23 @@ class JobDetailsWidget(Widget):
                 show_line_numbers=True,
                 classes="script-area",
             )
-            container.mount(script_area)
-
             logs_label = Static("Logs (stderr) [w to toggle]", classes="section-label")
-            container.mount(logs_label)
-            container.mount(Static("─" * 40, classes="separator"))
-
             logs_area = TextArea(
                 stderr_content,
                 read_only=True,
                 show_line_numbers=True,
                 classes="logs-area",
             )
-            container.mount(logs_area)
+            # One mount call so the whole tree gets a single layout pass
+            container.mount_all([
+                script_header,
+                script_path_label,
+                Static("─" * 40, classes="separator"),
+                script_area,
+                logs_label,
+                Static("─" * 40, classes="separator"),
+                logs_area,
+            ])
 
             self._script_header = script_header
             self._script_path_label = script_path_label
@@ -480,10 +483,7 @@ class JobDetailsWidget(Widget):
         """Append new log text.  Only auto-scrolls if user was already at bottom."""
         try:
             if self._logs_area:
-                was_at_bottom = self._logs_area.scroll_y >= self._logs_area.max_scroll_y
-                self._logs_area.insert(new_text, self._logs_area.document.end)
-                if was_at_bottom:
-                    self._logs_area.scroll_end(animate=False)
+                append_log_text(self._logs_area, new_text)
         except Exception:
             pass
 
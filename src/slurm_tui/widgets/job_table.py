@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+from rich.text import Text
 from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal
+from textual.coordinate import Coordinate
 from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import Static, DataTable
 from textual.widget import Widget
-from textual.worker import get_current_worker
+from textual.worker import Worker, get_current_worker
 
-from ..utils.slurm import SlurmClient, Job
+from ..utils.slurm import SlurmClient, Job, get_slurm_client
 
 
 # Status symbols with colors
@@ -25,6 +30,41 @@ STATUS_SYMBOLS = {
     "NF": ("✗", "#f7768e"),   # Node Fail - red
 }
 
+# Cells are pre-styled Text rather than markup strings: the DataTable
+# renders Text as is, where a str is run through the markup parser on
+# every render, and job names or reasons containing "[" stay literal.
+
+# Rendered state cells; symbol and color are fixed per state, so build them once
+STATE_DISPLAY = {
+    state: Text.styled(f"{symbol} {state:3}", color)
+    for state, (symbol, color) in STATUS_SYMBOLS.items()
+}
+
+# Placeholder cells shared by every row that has no GPU / runtime
+_NO_GPU_DISPLAY = Text.styled(" -", "#414868")
+_NO_TIME_DISPLAY = Text.styled("      —", "#414868")
+
+
+@lru_cache(maxsize=4096)
+def _cell(text: str, color: str = "") -> Text:
+    """Styled cell, shared by every row and refresh showing the same value.
+
+    Building a Text costs far more than the f-string feeding it, and most
+    cells (ids, names, partitions) repeat on every refresh.  Identical
+    objects also let the row diff skip them with an identity check.
+    """
+    return Text.styled(text, color)
+
+# Characters of the job name shown in the name column
+_NAME_WIDTH = 20
+
+# While squeue keeps returning the same jobs, each refresh doubles the
+# poll interval up to this many seconds; any change or keypress resets it
+_MAX_IDLE_INTERVAL = 60.0
+
+# Seconds the cursor must rest on a row before its details are loaded
+_HIGHLIGHT_DEBOUNCE = 0.2
+
 HEADER_ALL = "    ID       Name                   User         State    Part      QOS          GPU     Time"
 HEADER_MY  = "    ID       Name                   State    Part      QOS          GPU     Time"
 
@@ -155,18 +195,33 @@ class JobTableWidget(Widget):
         self,
         slurm_client: SlurmClient | None = None,
         refresh_interval: float = 10.0,
+        auto_poll: bool = True,
         **kwargs,
     ):
         super().__init__(**kwargs)
-        self.slurm_client = slurm_client or SlurmClient()
+        self.slurm_client = slurm_client or get_slurm_client()
         self.refresh_interval = refresh_interval
+        self.auto_poll = auto_poll
         self._timer = None
+        self._refresh_worker: Worker | None = None
+        self._base_interval = refresh_interval
+        # (job_id, state, reason) per job from the last refresh; runtimes
+        # tick on every poll and are deliberately left out
+        self._job_signature: list[tuple[str, str, str]] | None = None
         self._selected_job: Job | None = None
         self._sort_col_index: int | None = None
         self._sort_reverse: bool = False
         self._display_jobs: list[Job] = []
         self._selected_ids: set[str] = set()
         self._table_has_user_col: bool = False
+        # What the DataTable currently shows, for in-place cell updates
+        self._row_ids: list[str] = []
+        self._row_cells: list[tuple[Text, ...]] = []
+        self._highlight_timer: Timer | None = None
+        # Children looked up once in on_mount; refreshes reuse them
+        self._table: DataTable | None = None
+        self._header: Static | None = None
+        self._count_label: Static | None = None
         # Plain attributes (formerly reactives — no watchers existed, so the
         # default reactive refresh() pass was pure overhead per 10s tick).
         self.jobs: list[Job] = []
@@ -197,12 +252,29 @@ class JobTableWidget(Widget):
 
     def on_mount(self) -> None:
         """Start timer and load initial data."""
+        self._table = self.query_one(DataTable)
+        self._header = self.query_one("#column-header", Static)
+        self._count_label = self.query_one("#jobs-count", Static)
+        if not self.auto_poll:
+            return  # The parent screen schedules refresh_data()
         self.refresh_data()
         self._timer = self.set_interval(self.refresh_interval, self.refresh_data)
 
-    @work(thread=True, exclusive=True)
     def refresh_data(self) -> None:
-        """Refresh job data in background thread."""
+        """Refresh job data, unless a squeue call is still running.
+
+        A cancelled thread worker keeps waiting on its subprocess, so
+        relying on exclusive=True alone would let a slow controller
+        collect one squeue per tick.  Ticks are dropped instead; the
+        running call delivers fresh data anyway.
+        """
+        if self._refresh_worker is not None and not self._refresh_worker.is_finished:
+            return
+        self._refresh_worker = self._fetch_jobs()
+
+    @work(thread=True, exclusive=True)
+    def _fetch_jobs(self) -> None:
+        """Fetch jobs from squeue in a background thread."""
         worker = get_current_worker()
         try:
             jobs = self.slurm_client.get_jobs(all_users=self.show_all_users)
@@ -214,7 +286,7 @@ class JobTableWidget(Widget):
     def _apply_refresh(self, jobs: list[Job]) -> None:
         """Apply refreshed job data on the main thread."""
         try:
-            table = self.query_one(DataTable)
+            table = self._table
             old_cursor_row = table.cursor_row
             old_job_id = None
             if old_cursor_row is not None and old_cursor_row < len(self._display_jobs):
@@ -223,11 +295,48 @@ class JobTableWidget(Widget):
             self._update_table(old_job_id)
         except Exception:
             pass
+        self._adapt_refresh_interval(jobs)
+
+    # ── Idle backoff ──────────────────────────────────────────────
+    #
+    # Most of the time nothing happens to a user's jobs between polls:
+    # the same jobs are running or waiting and only their runtimes move.
+    # Each unchanged refresh doubles refresh_interval (capped), so an idle
+    # dashboard drops from one squeue per 10s to one per minute.  The
+    # screen-level tick reads refresh_interval on every tick.
+
+    def _adapt_refresh_interval(self, jobs: list[Job]) -> None:
+        """Back off polling while the job list stays the same."""
+        signature = [(job.job_id, job.state, job.reason) for job in jobs]
+        if signature == self._job_signature:
+            cap = max(_MAX_IDLE_INTERVAL, self._base_interval)
+            self._set_refresh_interval(min(cap, self.refresh_interval * 2))
+        else:
+            self._job_signature = signature
+            self._set_refresh_interval(self._base_interval)
+
+    def reset_refresh_backoff(self) -> None:
+        """Return to the configured refresh interval (e.g. on user input)."""
+        self._set_refresh_interval(self._base_interval)
+
+    def _set_refresh_interval(self, interval: float) -> None:
+        """Change the poll interval, rescheduling our own timer if we have one."""
+        if interval == self.refresh_interval:
+            return
+        self.refresh_interval = interval
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = self.set_interval(interval, self.refresh_data)
 
     def _update_table(self, old_job_id: str | None = None) -> None:
-        """Update the data table with current jobs."""
-        table = self.query_one(DataTable)
+        """Update the data table with current jobs.
+
+        Rows are keyed by job id and updated as a diff against what the
+        table already shows where possible; otherwise they are rebuilt.
+        """
+        table = self._table
         show_user = self.show_all_users
+        rebuild = False
 
         # Rebuild columns when user-column visibility changes
         if show_user != self._table_has_user_col:
@@ -240,8 +349,7 @@ class JobTableWidget(Widget):
             # Reset sort when columns change
             self._sort_col_index = None
             self._sort_reverse = False
-        else:
-            table.clear()
+            rebuild = True
 
         # Sort jobs if sort is active
         if self._sort_col_index is not None:
@@ -253,84 +361,131 @@ class JobTableWidget(Widget):
         else:
             self._display_jobs = list(self.jobs)
 
-        # Update column header with sort indicator
-        header = self.query_one("#column-header", Static)
-        header.update(self._build_column_header())
-
-        for job in self._display_jobs:
-            # Status symbol with color
-            state = job.state
-            symbol, color = STATUS_SYMBOLS.get(state, ("?", "#565f89"))
-            state_display = f"[{color}]{symbol}[/] [{color}]{state:3}[/]"
-
-            # GPU with color
-            if job.gpus > 0:
-                gpu_display = f"[#bb9af7]{job.gpus:2}[/]"
+        row_ids = [job.job_id for job in self._display_jobs]
+        rows = [self._render_row(job, show_user) for job in self._display_jobs]
+
+        # Header, rows and count change together; batch them into one repaint
+        with self.app.batch_update():
+            # Update column header with sort indicator
+            self._header.update(self._build_column_header())
+
+            # Between refreshes finished jobs drop out and new submissions
+            # usually land at the end, so the surviving rows keep their order.
+            # Then only the differences are applied: gone rows are removed,
+            # changed cells patched and new rows appended.  Anything else
+            # (re-sort, reordering, the cursor's job vanishing) is rebuilt.
+            new_ids = set(row_ids)
+            kept = [job_id for job_id in self._row_ids if job_id in new_ids]
+            if (
+                not rebuild
+                and row_ids[:len(kept)] == kept
+                and (old_job_id is None or old_job_id in new_ids)
+            ):
+                old_cells = dict(zip(self._row_ids, self._row_cells))
+                for job_id in self._row_ids:
+                    if job_id not in new_ids:
+                        table.remove_row(job_id)
+                for row_index, job_id in enumerate(kept):
+                    cells = rows[row_index]
+                    previous = old_cells[job_id]
+                    if cells == previous:
+                        continue
+                    for col_index, (value, old_value) in enumerate(zip(cells, previous)):
+                        if value is not old_value and value != old_value:
+                            table.update_cell_at(
+                                Coordinate(row_index, col_index), value, update_width=True
+                            )
+                for job_id, cells in zip(row_ids[len(kept):], rows[len(kept):]):
+                    table.add_row(*cells, key=job_id)
             else:
-                gpu_display = "[#414868] -[/]"
-
-            # Time / Reason — for pending jobs the runtime is meaningless,
-            # so we show why squeue is keeping the job in the queue instead.
-            if job.state == "PD" and job.reason:
-                time_display = f"[#e0af68]{job.reason[:14]}[/]"
-            elif job.runtime and job.runtime != "0:00":
-                time_display = f"[#565f89]{job.runtime:>8}[/]"
+                table.clear()
+                for job_id, cells in zip(row_ids, rows):
+                    table.add_row(*cells, key=job_id)
+
+            # Restore cursor position
+            if old_job_id is not None:
+                for i, job_id in enumerate(row_ids):
+                    if job_id == old_job_id:
+                        table.move_cursor(row=i)
+                        break
+
+            self._row_ids = row_ids
+            self._row_cells = rows
+
+            # Update count
+            count_label = self._count_label
+            mode = "all" if self.show_all_users else "my jobs"
+            sel_count = len(self._selected_ids)
+            if sel_count > 0:
+                count_label.update(f"{mode} ({len(self.jobs)}) · {sel_count} selected")
             else:
-                time_display = "[#414868]      —[/]"
+                count_label.update(f"{mode} ({len(self.jobs)})")
 
-            # Partition
-            partition_display = f"[#7dcfff]{job.partition:<8}[/]"
+        # Notify other widgets about the refreshed job list
+        self.post_message(self.JobsRefreshed(self.jobs))
 
-            # Selection marker
-            if job.job_id in self._selected_ids:
-                id_display = f"[#f7768e]◉ {job.job_id:>6}[/]"
-            else:
-                id_display = f"[#c0caf5]  {job.job_id:>6}[/]"
+    def _render_row(self, job: Job, show_user: bool) -> tuple[Text, ...]:
+        """Build the styled cells for one job row."""
+        # Status symbol with color
+        state_display = STATE_DISPLAY.get(job.state)
+        if state_display is None:
+            state_display = _cell(f"? {job.state:3}", "#565f89")
 
-            # QOS
-            qos_display = f"[#e0af68]{job.qos[:10]:<10}[/]"
+        # GPU with color
+        if job.gpus > 0:
+            gpu_display = _cell(f"{job.gpus:2}", "#bb9af7")
+        else:
+            gpu_display = _NO_GPU_DISPLAY
+
+        # Time / Reason — for pending jobs the runtime is meaningless,
+        # so we show why squeue is keeping the job in the queue instead.
+        if job.state == "PD" and job.reason:
+            time_display = _cell(job.reason[:14], "#e0af68")
+        elif job.runtime and job.runtime != "0:00":
+            time_display = _cell(f"{job.runtime:>8}", "#565f89")
+        else:
+            time_display = _NO_TIME_DISPLAY
 
-            if show_user:
-                user_display = f"[#c0caf5]{job.user[:10]:<10}[/]"
-                table.add_row(
-                    id_display,
-                    f"{job.name[:20]:<20}",
-                    user_display,
-                    state_display,
-                    partition_display,
-                    qos_display,
-                    gpu_display,
-                    time_display,
-                )
-            else:
-                table.add_row(
-                    id_display,
-                    f"{job.name[:20]:<20}",
-                    state_display,
-                    partition_display,
-                    qos_display,
-                    gpu_display,
-                    time_display,
-                )
-
-        # Update count
-        count_label = self.query_one("#jobs-count", Static)
-        mode = "all" if self.show_all_users else "my jobs"
-        sel_count = len(self._selected_ids)
-        if sel_count > 0:
-            count_label.update(f"{mode} ({len(self.jobs)}) · {sel_count} selected")
+        # Partition
+        partition_display = _cell(f"{job.partition:<8}", "#7dcfff")
+
+        # Selection marker
+        if job.job_id in self._selected_ids:
+            id_display = _cell(f"◉ {job.job_id:>6}", "#f7768e")
         else:
-            count_label.update(f"{mode} ({len(self.jobs)})")
+            id_display = _cell(f"  {job.job_id:>6}", "#c0caf5")
 
-        # Notify other widgets about the refreshed job list
-        self.post_message(self.JobsRefreshed(self.jobs))
+        # QOS
+        qos_display = _cell(f"{job.qos[:10]:<10}", "#e0af68")
 
-        # Restore cursor position
-        if old_job_id is not None:
-            for i, job in enumerate(self._display_jobs):
-                if job.job_id == old_job_id:
-                    table.move_cursor(row=i)
-                    break
+        # Name, truncated or padded to the column width
+        name = job.name
+        if len(name) > _NAME_WIDTH:
+            name_display = _cell(name[:_NAME_WIDTH])
+        else:
+            name_display = _cell(name.ljust(_NAME_WIDTH))
+
+        if show_user:
+            user_display = _cell(f"{job.user[:10]:<10}", "#c0caf5")
+            return (
+                id_display,
+                name_display,
+                user_display,
+                state_display,
+                partition_display,
+                qos_display,
+                gpu_display,
+                time_display,
+            )
+        return (
+            id_display,
+            name_display,
+            state_display,
+            partition_display,
+            qos_display,
+            gpu_display,
+            time_display,
+        )
 
     @property
     def _col_positions(self) -> list[tuple[int, int]]:
@@ -422,18 +577,34 @@ class JobTableWidget(Widget):
             self.post_message(self.JobSelected(job, explicit=True))
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
-        """Notify of selection when cursor moves."""
+        """Notify of selection once the cursor settles.
+
+        Each JobSelected loads details and logs, so holding j/k would queue
+        a load per row; a short trailing timer loads only the final row.
+        """
+        if self._highlight_timer is not None:
+            self._highlight_timer.stop()
+        self._highlight_timer = self.set_timer(_HIGHLIGHT_DEBOUNCE, self._post_selected)
+
+    def _post_selected(self) -> None:
+        """Post JobSelected for the job under the cursor."""
+        self._highlight_timer = None
         job = self.get_selected_job()
         if job:
             self.post_message(self.JobSelected(job))
 
-    def get_selected_job(self) -> Job | None:
-        """Get the currently selected job."""
-        table = self.query_one(DataTable)
-        if table.cursor_row is not None and 0 <= table.cursor_row < len(self._display_jobs):
+    @property
+    def selected_job(self) -> Job | None:
+        """Job under the cursor (read from the cursor, so never stale after a refresh)."""
+        table = self._table
+        if table is not None and 0 <= table.cursor_row < len(self._display_jobs):
             return self._display_jobs[table.cursor_row]
         return None
 
+    def get_selected_job(self) -> Job | None:
+        """Get the currently selected job."""
+        return self.selected_job
+
     def action_toggle_select(self) -> None:
         """Toggle selection of the job under the cursor."""
         job = self.get_selected_job()
@@ -461,4 +632,5 @@ class JobTableWidget(Widget):
     def toggle_all_users(self) -> None:
         """Toggle between showing own jobs and all jobs."""
         self.show_all_users = not self.show_all_users
-        self.refresh_data()
+        # Bypass the in-flight check: a running call is for the old mode
+        self._refresh_worker = self._fetch_jobs()
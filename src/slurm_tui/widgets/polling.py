@@ -0,0 +1,48 @@
+"""Retry bookkeeping shared by widgets that poll Slurm GPU commands."""
+
+from __future__ import annotations
+
+import time
+
+# Upper bound for the retry delay after repeated fetch failures (seconds).
+_MAX_BACKOFF = 600.0
+
+
+class SlurmPollBackoff:
+    """Mixin: skip polls on hosts without Slurm and back off after failures.
+
+    Expects the widget to provide ``gpu_monitor`` and ``refresh_interval``.
+    The worker calls poll_allowed() first, then poll_failed() or
+    poll_succeeded() with the outcome of its fetch.
+    """
+
+    _fail_count: int = 0
+    _retry_at: float = 0.0
+    _disabled: bool = False
+
+    def poll_allowed(self) -> bool:
+        """Whether a fetch should run now."""
+        if self._disabled or time.monotonic() < self._retry_at:
+            return False  # No Slurm here, or backing off after failed fetches
+        if not self.gpu_monitor.is_available():
+            # Not a Slurm host: every poll would fail, so stop for good
+            self._disabled = True
+            self.log.debug(f"squeue unavailable; {type(self).__name__} polling disabled")
+            return False
+        return True
+
+    def poll_failed(self, reason: object) -> None:
+        """Double the wait before the next fetch after each consecutive failure."""
+        self.log.debug(f"{type(self).__name__} refresh failed: {reason!r}")
+        self._fail_count += 1
+        delay = min(_MAX_BACKOFF, self.refresh_interval * 2 ** self._fail_count)
+        self._retry_at = time.monotonic() + delay
+
+    def poll_succeeded(self) -> None:
+        """Reset the back-off after a good fetch."""
+        self._fail_count = 0
+
+    def reset_backoff(self) -> None:
+        """Allow the next poll right away (e.g. on a manual refresh)."""
+        self._fail_count = 0
+        self._retry_at = 0.0